@@ -1,6 +1,7 @@
 """Agent OS orchestration service layered on top of SHAMS ops tools."""
 from __future__ import annotations
 
+import asyncio
 import re
 import time
 from datetime import datetime, timezone
@@ -34,6 +35,7 @@ class AgentOSService:
     """Coordinator for high-autonomy Agent OS runs."""
 
     LOAD_ID_PATTERN = re.compile(r"\bLOAD[-_ ]?(\d{3,}[A-Z0-9]*)\b", re.IGNORECASE)
+    LOAD_SUFFIX_PATTERN = re.compile(r"0*(\d+)([A-Z0-9]*)")
     DRIVER_NAME_PATTERN = re.compile(r"\bnamed\s+([a-z][a-z'\-]*(?:\s+[a-z][a-z'\-]*){0,3})\b", re.IGNORECASE)
     DRIVER_ADD_INTENT_PATTERN = re.compile(
         r"\b(?:add|hire|onboard)\s+(?:a\s+|new\s+)?driver\b|\bnew\s+driver\b",
@@ -56,7 +58,7 @@ class AgentOSService:
         if not cleaned.startswith("LOAD"):
             cleaned = f"LOAD{cleaned}"
         suffix = cleaned[4:]
-        match = re.fullmatch(r"0*(\d+)([A-Z0-9]*)", suffix)
+        match = self.LOAD_SUFFIX_PATTERN.fullmatch(suffix)
         if not match:
             return cleaned
         digits = str(int(match.group(1))).zfill(5)
@@ -317,18 +319,15 @@ class AgentOSService:
         if action_type == AgentActionType.TICKET_REVIEW:
             board = ops_engine.dispatch_board(tenant_id)
             loads = board.get("loads", [])
-            latest_review_by_load: Dict[str, str] = {}
-            for review in ops_state_store.list_reviews(tenant_id):
-                load_id = str(review.get("load_id") or "")
-                if load_id and load_id not in latest_review_by_load:
-                    latest_review_by_load[load_id] = str(review.get("status") or "")
+            latest_review_by_load = ops_state_store.latest_reviews_by_load(tenant_id)
 
+            scoped = set(load_scope)
             candidates = []
             for row in loads:
                 load_id = str(row.get("load_id") or "")
                 if not load_id:
                     continue
-                if load_scope and load_id.upper() not in set(load_scope):
+                if scoped and load_id.upper() not in scoped:
                     continue
                 status = str(row.get("status") or "").lower()
                 if status not in {"assigned", "en_route"}:
@@ -340,18 +339,21 @@ class AgentOSService:
             reviewed: List[Dict[str, Any]] = []
             errors: List[str] = []
             confidences: List[float] = []
-            for load_id in candidates[: max_targets]:
-                try:
-                    result = await ops_engine.review_ticket(
-                        TicketReviewRequest(load_id=load_id),
-                        tenant_id=tenant_id,
-                        actor=actor,
-                    )
-                    payload = result.model_dump(mode="json")
-                    reviewed.append(payload)
-                    confidences.append(float(payload.get("final_confidence") or 0.0))
-                except Exception as exc:
-                    errors.append(f"{load_id}: {exc}")
+            targets = candidates[: max_targets]
+            results = await asyncio.gather(
+                *(
+                    ops_engine.review_ticket(TicketReviewRequest(load_id=load_id), tenant_id=tenant_id, actor=actor)
+                    for load_id in targets
+                ),
+                return_exceptions=True,
+            )
+            for load_id, result in zip(targets, results):
+                if isinstance(result, BaseException):
+                    errors.append(f"{load_id}: {result}")
+                    continue
+                payload = result.model_dump(mode="json")
+                reviewed.append(payload)
+                confidences.append(float(payload.get("final_confidence") or 0.0))
             confidence = round(sum(confidences) / max(1, len(confidences)), 4)
             return {"reviewed": reviewed, "errors": errors, "candidates": len(candidates)}, confidence
 
@@ -11,13 +11,31 @@ from typing import Any, Dict, List, Optional
 from app.core.config import get_settings
 from app.models.agent_os import AgentActionType, AgentPolicyRule
 
+# Same codec as the ops state store: orjson when installed, stdlib json otherwise.
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 def _utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def _json_dumps(value: Any) -> str:
-    return json.dumps(value, ensure_ascii=True)
+if HAS_ORJSON:
+
+    def _json_dumps(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    _json_loads = orjson.loads
+else:
+
+    def _json_dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=True, separators=(",", ":"))
+
+    _json_loads = json.loads
 
 
 class AgentOSStateStore:
@@ -161,23 +179,18 @@ class AgentOSStateStore:
             )
 
     def _next_sequence(self, key: str) -> int:
+        # One upsert both seeds a new counter and advances an existing one.
         row = self._conn.execute(
-            "SELECT next_value FROM agent_sequences WHERE key_name = ?",
+            """
+            INSERT INTO agent_sequences (key_name, next_value)
+            VALUES (?, 2)
+            ON CONFLICT(key_name)
+            DO UPDATE SET next_value = next_value + 1
+            RETURNING next_value
+            """,
             (key,),
         ).fetchone()
-        if row is None:
-            current = 1
-            self._conn.execute(
-                "INSERT INTO agent_sequences (key_name, next_value) VALUES (?, ?)",
-                (key, current + 1),
-            )
-            return current
-        value = int(row["next_value"])
-        self._conn.execute(
-            "UPDATE agent_sequences SET next_value = ? WHERE key_name = ?",
-            (value + 1, key),
-        )
-        return value
+        return int(row["next_value"]) - 1
 
     def next_run_id(self) -> str:
         with self._lock:
@@ -220,7 +233,7 @@ class AgentOSStateStore:
             ).fetchone()
         if not row:
             return None
-        return json.loads(row["data_json"])
+        return _json_loads(row["data_json"])
 
     def list_runs(self, tenant_id: str, limit: int = 50) -> List[Dict[str, Any]]:
         with self._lock:
@@ -233,7 +246,7 @@ class AgentOSStateStore:
                 """,
                 (tenant_id, max(1, min(limit, 500))),
             ).fetchall()
-        return [json.loads(row["data_json"]) for row in rows]
+        return [_json_loads(row["data_json"]) for row in rows]
 
     def upsert_step(self, step_id: str, run_id: str, step_index: int, status: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         now = _utc_now_iso()
@@ -260,7 +273,7 @@ class AgentOSStateStore:
                 """,
                 (run_id,),
             ).fetchall()
-        return [json.loads(row["data_json"]) for row in rows]
+        return [_json_loads(row["data_json"]) for row in rows]
 
     def get_step(self, step_id: str) -> Optional[Dict[str, Any]]:
         with self._lock:
@@ -270,7 +283,7 @@ class AgentOSStateStore:
             ).fetchone()
         if not row:
             return None
-        return json.loads(row["data_json"])
+        return _json_loads(row["data_json"])
 
     def upsert_approval(self, approval_id: str, run_id: str, step_id: str, status: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         now = _utc_now_iso()
@@ -295,7 +308,7 @@ class AgentOSStateStore:
             ).fetchone()
         if not row:
             return None
-        return json.loads(row["data_json"])
+        return _json_loads(row["data_json"])
 
     def list_approvals(self, run_id: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
         with self._lock:
@@ -317,7 +330,7 @@ class AgentOSStateStore:
                     """,
                     (run_id,),
                 ).fetchall()
-        return [json.loads(row["data_json"]) for row in rows]
+        return [_json_loads(row["data_json"]) for row in rows]
 
     def list_pending_approvals(self, tenant_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         with self._lock:
@@ -332,14 +345,14 @@ class AgentOSStateStore:
                 """,
                 (tenant_id, max(1, min(limit, 1000))),
             ).fetchall()
-        return [json.loads(row["data_json"]) for row in rows]
+        return [_json_loads(row["data_json"]) for row in rows]
 
     def list_policies(self) -> List[Dict[str, Any]]:
         with self._lock:
             rows = self._conn.execute(
                 "SELECT data_json FROM agent_policies ORDER BY policy_id ASC",
             ).fetchall()
-        return [json.loads(row["data_json"]) for row in rows]
+        return [_json_loads(row["data_json"]) for row in rows]
 
     def get_policy_for_action(self, action_type: str) -> Optional[Dict[str, Any]]:
         with self._lock:
@@ -354,7 +367,7 @@ class AgentOSStateStore:
             ).fetchone()
         if not row:
             return None
-        return json.loads(row["data_json"])
+        return _json_loads(row["data_json"])
 
     def update_policy(self, policy_id: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         now = _utc_now_iso()
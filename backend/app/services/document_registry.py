@@ -7,7 +7,7 @@ from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 from app.core.config import get_settings
 from app.core.logging import logger
@@ -51,6 +51,12 @@ class DocumentRegistry:
             json.dump(self._state, handle, indent=2, ensure_ascii=True)
         tmp_path.replace(self._path)
 
+    def _documents(self) -> List[Dict[str, Any]]:
+        # Reviews read the registry from worker threads while uploads upsert into it; writers replace
+        # records under the lock, so scanning a snapshot of the values taken under it is safe.
+        with self._lock:
+            return list(self._state.get("documents", {}).values())
+
     @staticmethod
     def _normalize_identifier(value: str) -> str:
         normalized = value.upper().replace(" ", "").replace("_", "").replace("-", "")
@@ -111,10 +117,9 @@ class DocumentRegistry:
             "rate_conf_numbers": uniq(rate_conf_numbers),
         }
 
-    def upsert(self, document: Document, tenant_id: str = "demo") -> Dict[str, Any]:
-        """Persist or update a document record."""
+    def _record(self, document: Document, tenant_id: str) -> Dict[str, Any]:
         identifiers = self._extract_ids(document)
-        record = {
+        return {
             "id": document.id,
             "tenant_id": tenant_id,
             "filename": document.filename,
@@ -129,6 +134,10 @@ class DocumentRegistry:
             "updated_at": datetime.now(timezone.utc).isoformat(),
         }
 
+    def upsert(self, document: Document, tenant_id: str = "demo") -> Dict[str, Any]:
+        """Persist or update a document record."""
+        record = self._record(document, tenant_id)
+
         with self._lock:
             self._state.setdefault("documents", {})
             self._state["documents"][document.id] = record
@@ -143,14 +152,47 @@ class DocumentRegistry:
         )
         return record
 
+    def upsert_bulk(self, documents: Sequence[Document], tenant_id: str = "demo") -> List[Dict[str, Any]]:
+        """Persist or update many document records with a single registry write."""
+        records = [self._record(document, tenant_id) for document in documents]
+        if not records:
+            return []
+
+        with self._lock:
+            stored = self._state.setdefault("documents", {})
+            stored.update((record["id"], record) for record in records)
+            self._save()
+
+        logger.info(
+            "Documents added to registry",
+            tenant_id=tenant_id,
+            documents=len(records),
+        )
+        return records
+
     def get(self, document_id: str, tenant_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        record = self._state.get("documents", {}).get(document_id)
+        with self._lock:
+            record = self._state.get("documents", {}).get(document_id)
         if not record:
             return None
         if tenant_id is not None and record.get("tenant_id") != tenant_id:
             return None
         return record
 
+    def get_many(self, document_ids: Sequence[str], tenant_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Fetch several documents in request order, skipping unknown or foreign-tenant ids."""
+        with self._lock:
+            documents = self._state.get("documents", {})
+            records = [documents.get(document_id) for document_id in document_ids]
+        found: List[Dict[str, Any]] = []
+        for record in records:
+            if not record:
+                continue
+            if tenant_id is not None and record.get("tenant_id") != tenant_id:
+                continue
+            found.append(record)
+        return found
+
     def list(
         self,
         tenant_id: str = "demo",
@@ -158,8 +200,7 @@ class DocumentRegistry:
         load_id: Optional[str] = None,
         limit: int = 100,
     ) -> List[Dict[str, Any]]:
-        docs = list(self._state.get("documents", {}).values())
-        docs = [doc for doc in docs if doc.get("tenant_id", "demo") == tenant_id]
+        docs = [doc for doc in self._documents() if doc.get("tenant_id", "demo") == tenant_id]
 
         if document_type:
             docs = [doc for doc in docs if doc.get("document_type") == document_type.value]
@@ -176,21 +217,46 @@ class DocumentRegistry:
 
     def find_related(self, load_id: str, tenant_id: str = "demo") -> List[Dict[str, Any]]:
         """Return all documents that appear related to a load."""
-        normalized = self._normalize_identifier(load_id)
+        normalize = self._normalize_identifier
+        normalized = normalize(load_id)
         results = []
-        for doc in self._state.get("documents", {}).values():
+        for doc in self._documents():
             if doc.get("tenant_id", "demo") != tenant_id:
                 continue
             candidates = doc.get("load_ids", [])
-            if any(self._normalize_identifier(candidate) == normalized for candidate in candidates):
+            if any(normalize(candidate) == normalized for candidate in candidates):
                 results.append(doc)
                 continue
             text = doc.get("raw_text", "")
-            if normalized in self._normalize_identifier(text):
+            if normalized in normalize(text):
                 results.append(doc)
         results.sort(key=lambda item: item.get("updated_at", ""), reverse=True)
         return results
 
+    def find_related_bulk(self, load_ids: Sequence[str], tenant_id: str = "demo") -> Dict[str, List[Dict[str, Any]]]:
+        """``find_related`` for several loads in one pass over the registry, keyed by the requested ids."""
+        normalize = self._normalize_identifier
+        wanted = {load_id: normalize(load_id) for load_id in load_ids}
+        results: Dict[str, List[Dict[str, Any]]] = {load_id: [] for load_id in wanted}
+        if not wanted:
+            return results
+        for doc in self._documents():
+            if doc.get("tenant_id", "demo") != tenant_id:
+                continue
+            candidates = {normalize(candidate) for candidate in doc.get("load_ids", [])}
+            text = None
+            for load_id, normalized in wanted.items():
+                if normalized in candidates:
+                    results[load_id].append(doc)
+                    continue
+                if text is None:
+                    text = normalize(doc.get("raw_text", ""))
+                if normalized in text:
+                    results[load_id].append(doc)
+        for docs in results.values():
+            docs.sort(key=lambda item: item.get("updated_at", ""), reverse=True)
+        return results
+
     def find_by_identifier(
         self,
         identifier: str,
@@ -202,18 +268,19 @@ class DocumentRegistry:
 
         Supported fields include: load_ids, pro_numbers, bol_numbers, rate_conf_numbers.
         """
-        normalized = self._normalize_identifier(identifier)
+        normalize = self._normalize_identifier
+        normalized = normalize(identifier)
         fields = fields or ["load_ids", "pro_numbers", "bol_numbers", "rate_conf_numbers"]
         results = []
 
-        for doc in self._state.get("documents", {}).values():
+        for doc in self._documents():
             if doc.get("tenant_id", "demo") != tenant_id:
                 continue
 
             matched = False
             for field in fields:
                 candidates = doc.get(field, []) or []
-                if any(self._normalize_identifier(str(candidate)) == normalized for candidate in candidates):
+                if any(normalize(str(candidate)) == normalized for candidate in candidates):
                     matched = True
                     break
 
@@ -222,7 +289,7 @@ class DocumentRegistry:
                 continue
 
             text = doc.get("raw_text", "")
-            if normalized in self._normalize_identifier(text):
+            if normalized in normalize(text):
                 results.append(doc)
 
         results.sort(key=lambda item: item.get("updated_at", ""), reverse=True)
@@ -236,7 +303,7 @@ class DocumentRegistry:
                 self._save()
 
     def get_stats(self, tenant_id: Optional[str] = None) -> Dict[str, Any]:
-        documents = list(self._state.get("documents", {}).values())
+        documents = self._documents()
         if tenant_id is not None:
             documents = [doc for doc in documents if doc.get("tenant_id", "demo") == tenant_id]
         by_type = Counter(doc.get("document_type", "other") for doc in documents)
@@ -39,6 +39,7 @@ class FreeRoamAgent:
     """OpenRouter-backed copilot with tool calls over the existing ops engine."""
 
     LOAD_ID_PATTERN = re.compile(r"\bLOAD[-_ ]?(\d{3,}[A-Z0-9]*)\b", re.IGNORECASE)
+    LOAD_SUFFIX_PATTERN = re.compile(r"0*(\d+)([A-Z0-9]*)")
     TICKET_PATTERN = re.compile(r"\b(?:ticket|tkt|tk)\s*#?\s*[:\-]?\s*([A-Z0-9\-]{5,})\b", re.IGNORECASE)
 
     def __init__(self, ops_engine: Any) -> None:
@@ -72,7 +73,7 @@ class FreeRoamAgent:
         if not text.startswith("LOAD"):
             text = f"LOAD{text}"
         suffix = text[4:]
-        match = re.fullmatch(r"0*(\d+)([A-Z0-9]*)", suffix)
+        match = cls.LOAD_SUFFIX_PATTERN.fullmatch(suffix)
         if not match:
             return text
         return f"LOAD{str(int(match.group(1))).zfill(5)}{match.group(2)}"
@@ -789,39 +790,41 @@ class FreeRoamAgent:
             if str(row.get("status") or "").lower() == "exception" and (row.get("missing_documents") or [])
         ][:max_items]
         reminders = []
-        for row in flagged:
-            load_id = str(row.get("load_id") or "")
-            load = ops_state_store.get_load(tenant_id, load_id) or {}
-            assignment = load.get("assignment") or {}
-            driver_name = str(assignment.get("driver_name") or assignment.get("driver_id") or "driver")
-            broker = str(load.get("broker") or "broker")
-            missing = ", ".join(row.get("missing_documents") or [])
-            note = (
-                f"Reminder: ticket {row.get('ticket_number')} for {load_id} is missing [{missing}]. "
-                f"Please upload before billing cutoff."
-            )
-            msg_driver = ops_state_store.add_outbound_message(
-                tenant_id,
-                channel="driver_reminder",
-                recipient=driver_name,
-                payload={"load_id": load_id, "note": note, "ticket_number": row.get("ticket_number")},
-                status="queued",
-            )
-            msg_broker = ops_state_store.add_outbound_message(
-                tenant_id,
-                channel="broker_reminder",
-                recipient=broker,
-                payload={"load_id": load_id, "note": note, "ticket_number": row.get("ticket_number")},
-                status="queued",
-            )
-            reminders.append({"load_id": load_id, "driver_msg": msg_driver, "broker_msg": msg_broker})
-            ops_state_store.record_timeline_event(
-                tenant_id,
-                load_id,
-                event_type="missing_docs_reminder_queued",
-                actor=actor,
-                details={"ticket_number": row.get("ticket_number"), "missing_documents": row.get("missing_documents")},
-            )
+        # Both reminders and the timeline entry for every ticket land in one store transaction.
+        with ops_state_store.batch(tenant_id):
+            for row in flagged:
+                load_id = str(row.get("load_id") or "")
+                load = ops_state_store.get_load(tenant_id, load_id) or {}
+                assignment = load.get("assignment") or {}
+                driver_name = str(assignment.get("driver_name") or assignment.get("driver_id") or "driver")
+                broker = str(load.get("broker") or "broker")
+                missing = ", ".join(row.get("missing_documents") or [])
+                note = (
+                    f"Reminder: ticket {row.get('ticket_number')} for {load_id} is missing [{missing}]. "
+                    f"Please upload before billing cutoff."
+                )
+                msg_driver = ops_state_store.add_outbound_message(
+                    tenant_id,
+                    channel="driver_reminder",
+                    recipient=driver_name,
+                    payload={"load_id": load_id, "note": note, "ticket_number": row.get("ticket_number")},
+                    status="queued",
+                )
+                msg_broker = ops_state_store.add_outbound_message(
+                    tenant_id,
+                    channel="broker_reminder",
+                    recipient=broker,
+                    payload={"load_id": load_id, "note": note, "ticket_number": row.get("ticket_number")},
+                    status="queued",
+                )
+                reminders.append({"load_id": load_id, "driver_msg": msg_driver, "broker_msg": msg_broker})
+                ops_state_store.record_timeline_event(
+                    tenant_id,
+                    load_id,
+                    event_type="missing_docs_reminder_queued",
+                    actor=actor,
+                    details={"ticket_number": row.get("ticket_number"), "missing_documents": row.get("missing_documents")},
+                )
         return {"queued": len(reminders), "items": reminders}
 
     async def _tool_billing_export_and_email(
@@ -1028,7 +1031,7 @@ class FreeRoamAgent:
         if not self.is_enabled():
             return None
 
-        started = time.time()
+        started = time.perf_counter()
         user_query = str(query or "").strip()
         if not user_query:
             return None
@@ -1056,7 +1059,7 @@ class FreeRoamAgent:
                 answer += f" Assignments: {preview}."
             if result.get("errors"):
                 answer += f" First issue: {result['errors'][0]}."
-            elapsed = (time.time() - started) * 1000
+            elapsed = (time.perf_counter() - started) * 1000
             self._remember(tenant_id, actor, session_id, "user", user_query)
             self._remember(tenant_id, actor, session_id, "assistant", answer)
             return CopilotQueryResponse(
@@ -1077,7 +1080,7 @@ class FreeRoamAgent:
             )
             if not available:
                 answer = "No drivers are currently available."
-            elapsed = (time.time() - started) * 1000
+            elapsed = (time.perf_counter() - started) * 1000
             self._remember(tenant_id, actor, session_id, "user", user_query)
             self._remember(tenant_id, actor, session_id, "assistant", answer)
             return CopilotQueryResponse(
@@ -1101,7 +1104,7 @@ class FreeRoamAgent:
                 if result.get("errors"):
                     answer += f" First issue: {result['errors'][0]}."
                 actions = [{"tool": "dispatch_send_batch", "args": {"limit": 10}, "ok": True, "preview": str(result)[:220]}]
-            elapsed = (time.time() - started) * 1000
+            elapsed = (time.perf_counter() - started) * 1000
             self._remember(tenant_id, actor, session_id, "user", user_query)
             self._remember(tenant_id, actor, session_id, "assistant", answer)
             return CopilotQueryResponse(
@@ -1123,7 +1126,7 @@ class FreeRoamAgent:
             else:
                 lines = [f"{row.get('ticket_number')} ({row.get('load_id')})" for row in flagged]
                 answer = f"{len(flagged)} flagged ticket(s): " + " | ".join(lines)
-            elapsed = (time.time() - started) * 1000
+            elapsed = (time.perf_counter() - started) * 1000
             self._remember(tenant_id, actor, session_id, "user", user_query)
             self._remember(tenant_id, actor, session_id, "assistant", answer)
             return CopilotQueryResponse(
@@ -1157,7 +1160,7 @@ class FreeRoamAgent:
             if "miles" in q:
                 answer_parts.append(f"planned miles {facts.get('planned_miles')}")
             answer = ", ".join(answer_parts)
-            elapsed = (time.time() - started) * 1000
+            elapsed = (time.perf_counter() - started) * 1000
             self._remember(tenant_id, actor, session_id, "user", user_query)
             self._remember(tenant_id, actor, session_id, "assistant", answer)
             return CopilotQueryResponse(
@@ -1172,7 +1175,7 @@ class FreeRoamAgent:
         if "resolve" in q and any(token in q for token in ["flagged ticket", "flagged tickets", "exceptions", "exception queue"]):
             count = 2 if "2" in q or "two" in q else 1
             result = await self._tool_resolve_flagged_tickets(tenant_id, count, actor)
-            elapsed = (time.time() - started) * 1000
+            elapsed = (time.perf_counter() - started) * 1000
             resolved_count = int(result.get("resolved_count") or 0)
             answer = f"Resolved {resolved_count} flagged ticket(s)."
             if result.get("errors"):
@@ -1200,7 +1203,7 @@ class FreeRoamAgent:
             exported = int(result.get("exported") or 0)
             email_status = (result.get("email") or {}).get("status") or "queued_local"
             answer = f"Exported {exported} billing artifact(s) and {email_status} accounting notification."
-            elapsed = (time.time() - started) * 1000
+            elapsed = (time.perf_counter() - started) * 1000
             self._remember(tenant_id, actor, session_id, "user", user_query)
             self._remember(tenant_id, actor, session_id, "assistant", answer)
             return CopilotQueryResponse(
@@ -1219,7 +1222,7 @@ class FreeRoamAgent:
                 f"drivers available {digest.get('drivers_available')}/{digest.get('drivers_total')}, "
                 f"flagged tickets {digest.get('flagged_tickets')}, billing ready {digest.get('billing_ready')}."
             )
-            elapsed = (time.time() - started) * 1000
+            elapsed = (time.perf_counter() - started) * 1000
             self._remember(tenant_id, actor, session_id, "user", user_query)
             self._remember(tenant_id, actor, session_id, "assistant", answer)
             return CopilotQueryResponse(
@@ -1304,7 +1307,7 @@ class FreeRoamAgent:
                 answer = str(message.content or "").strip()
                 if not answer:
                     answer = "Done. I executed available actions. Ask for a dispatch/ticket/billing check for details."
-                elapsed = (time.time() - started) * 1000
+                elapsed = (time.perf_counter() - started) * 1000
                 sources = [{"filename": "agent_actions", "document_type": "system_state", "similarity": 1.0}]
                 confidence = 0.91 if actions else 0.82
                 lowered = answer.lower()
@@ -1324,7 +1327,7 @@ class FreeRoamAgent:
             logger.error("Free-roam agent execution failed", error=str(exc), tenant_id=tenant_id)
             return None
 
-        elapsed = (time.time() - started) * 1000
+        elapsed = (time.perf_counter() - started) * 1000
         return CopilotQueryResponse(
             answer="I hit the action-step limit. Ask me to continue from current state.",
             sources=[{"filename": "agent_actions", "document_type": "system_state", "similarity": 1.0}],
@@ -95,12 +95,7 @@ class InvoicePacketWorkflow:
     def _pick_best(self, docs: List[Dict[str, Any]], load_id: str) -> Optional[Dict[str, Any]]:
         if not docs:
             return None
-        ranked = sorted(
-            docs,
-            key=lambda item: self._score_document_match(item, load_id),
-            reverse=True,
-        )
-        return ranked[0]
+        return max(docs, key=lambda item: self._score_document_match(item, load_id))
 
     def _find_related_records(self, request: InvoicePacketRequest, tenant_id: str) -> List[Dict[str, Any]]:
         related: List[Dict[str, Any]] = []
@@ -313,7 +308,7 @@ class InvoicePacketWorkflow:
     async def assemble_packet(self, request: InvoicePacketRequest, tenant_id: str = "demo") -> InvoicePacket:
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         packet = InvoicePacket(load_id=request.load_id, status=WorkflowStatus.IN_PROGRESS)
 
         logger.info("Starting invoice packet assembly", tenant_id=tenant_id, load_id=request.load_id)
@@ -342,7 +337,7 @@ class InvoicePacketWorkflow:
         if not packet.next_actions and packet.status == WorkflowStatus.COMPLETED:
             packet.next_actions.append("Submit packet to broker AP contact.")
 
-        elapsed = time.time() - start_time
+        elapsed = time.perf_counter() - start_time
         metrics = self._metrics_for(tenant_id)
         metrics["packets_generated"] += 1
         metrics["total_time_seconds"] += elapsed
@@ -1,10 +1,15 @@
 """Core engine for autonomous SHAMS dispatch, ticketing, billing, and copilot workflows."""
 from __future__ import annotations
 
+import asyncio
 import re
 import time
+from collections import defaultdict
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
 from datetime import datetime, timezone
+from functools import cached_property, lru_cache
+from threading import Lock
 from typing import Any, Dict, List, Optional
 
 import httpx
@@ -44,11 +49,406 @@ from app.services.rag_engine import rag_engine
 from app.services.vector_store import vector_store
 
 
+_IN_PROGRESS_STATUSES = frozenset({LoadStatus.ASSIGNED.value, LoadStatus.EN_ROUTE.value})
+_CLEARED_TICKET_STATUSES = frozenset({TicketStatus.APPROVED.value, TicketStatus.RESOLVED.value})
+
+
+# Copilot intent vocabulary: each group is true when any of its phrases occurs as a substring of the query.
+_INTENT_PHRASES: Dict[str, tuple[str, ...]] = {
+    "why": ("why", "how come"),
+    "review_ticket": ("review ticket", "ticket review", "run ticket review", "audit ticket", "run ticet review"),
+    "diagnose": ("why", "what is wrong"),
+    "driver_activity": ("loads did", "miles did", "how many miles", "how many loads", "which loads", "past week"),
+    "flagged": (
+        "flagged",
+        "flag",
+        "exception",
+        "exceptions",
+        "denied",
+        "rejected",
+        "failed",
+        "did not pass",
+        "didn't pass",
+        "not pass",
+    ),
+    "ticket_verdict": ("pass", "passed", "approved", "rejected", "status"),
+    "ticket_issue": ("wrong", "issue", "problem", "deny", "denied", "flag", "failed"),
+    "route": ("route", "pickup", "dropoff", "location", "drop off", "pick up"),
+    "miles": ("mile", "miles"),
+    "stops": ("stop", "stops"),
+    "ownership": ("who did", "who has", "who took", "assigned to", "who is on", "who owns", "what driver did"),
+    "auto_assign": ("auto assign", "assign new loads", "schedule loads", "schedule load"),
+    "assign_all": ("assign them", "assign those", "available drivers", "assign all available"),
+    "drivers_done": ("finished", "done", "completed", "all my drivers are taken", "drivers are taken"),
+    "driver_roster": ("who are my drivers", "list drivers", "my drivers", "who are the drivers", "driver roster"),
+    "board_summary": ("how many loads", "active loads", "unassigned", "dispatch board"),
+    "load_status": ("status", "assigned", "driver"),
+    "load_status_owner": ("status", "assigned", "driver", "who did", "who has"),
+    "follow_up": ("you do it", "do it", "handle it", "resolve it", "assign them"),
+    "load": ("load",),
+    "load_word": ("load ",),
+    "assign": ("assign",),
+    "schedule": ("schedule",),
+    "complete": ("complete",),
+    "driver": ("driver",),
+    "fleet": ("fleet",),
+    "how_many": ("how many",),
+    "available": ("available",),
+    "drivers_taken": ("drivers are taken",),
+    "broker": ("broker",),
+    "invoice": ("invoice", "inv"),
+    "rate": ("rate", "rpm"),
+    "bol": ("bol", "bill of lading", "pro "),
+}
+# Groups matched against whole words, so short abbreviations like "tk" cannot fire inside longer words.
+_INTENT_WORDS: Dict[str, frozenset[str]] = {
+    "ticket_queue": frozenset({"ticket", "tickets", "queue", "tkt", "tk"}),
+    "ticket": frozenset({"ticket", "tickets", "tkt", "tk"}),
+}
+_DOC_FACT_INTENTS = frozenset({"broker", "invoice", "rate", "bol"})
+_INVOICE_TYPE = DocumentType.INVOICE.value
+_RATE_CONF_TYPE = DocumentType.RATE_CONFIRMATION.value
+_BOL_TYPE = DocumentType.BOL.value
+_DOC_FACT_TYPES = frozenset({_INVOICE_TYPE, _RATE_CONF_TYPE, _BOL_TYPE})
+# Demo-pack indexing sends chunks to the embedding provider in windows of this size.
+_EMBED_BATCH = 128
+_EMBED_CONCURRENCY = 4
+# Ticket reviews an autonomy cycle keeps in flight at once.
+_AUTONOMY_REVIEW_CONCURRENCY = 8
+_WORD_PATTERN = re.compile(r"[a-z]+")
+_DIRECT_ACTION_PATTERN = re.compile(r"^\s*(do|assign|schedule|take|run)\b")
+# Whole-query roster questions the route table always sends to the driver overview;
+# they skip signal extraction and the route walk.
+_DRIVER_LISTING_QUERIES = frozenset(
+    {
+        "how many drivers",
+        "how many drivers do i have",
+        "list drivers",
+        "list my drivers",
+        "list all drivers",
+        "my drivers",
+        "who are my drivers",
+        "who are the drivers",
+        "driver roster",
+        "which drivers are available",
+        "available drivers",
+    }
+)
+
+
+def _build_intent_scanner() -> tuple[re.Pattern[str], Dict[str, frozenset[str]]]:
+    phrase_groups: Dict[str, set[str]] = {}
+    for group, phrases in _INTENT_PHRASES.items():
+        for phrase in phrases:
+            phrase_groups.setdefault(phrase, set()).add(group)
+    # The scan reports only the longest phrase starting at each offset, so each phrase
+    # also carries the groups of every shorter phrase it contains.
+    closure = {
+        phrase: frozenset().union(*(groups for other, groups in phrase_groups.items() if other in phrase))
+        for phrase in phrase_groups
+    }
+    ordered = sorted(phrase_groups, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(phrase) for phrase in ordered) + "))")
+    return pattern, closure
+
+
+_INTENT_SCAN, _INTENT_CLOSURE = _build_intent_scanner()
+
+
+@lru_cache(maxsize=1024)
+def _query_intents(text: str) -> frozenset[str]:
+    """Every intent group whose phrases occur in ``text``, found in a single regex pass."""
+    found: set[str] = set()
+    for match in _INTENT_SCAN.finditer(text):
+        found |= _INTENT_CLOSURE[match.group(1)]
+    words = frozenset(_WORD_PATTERN.findall(text))
+    found.update(group for group, vocabulary in _INTENT_WORDS.items() if not vocabulary.isdisjoint(words))
+    return frozenset(found)
+
+
+# Demo-pack raw text, rendered with str.format_map over one field dict per load.
+_DEMO_RATE_CONF_TEXT = (
+    "Rate Confirmation {rate_conf}\n"
+    "Load: {load_id}\nBroker: {broker}\nCustomer: {customer}\n"
+    "Pickup: {pickup} | Delivery: {delivery}\n"
+    "Miles: {miles}\nRate: {total_usd}\nRate per mile: {rate_per_mile_usd}\n"
+    "Target rate quality: lane verified for detention and billing."
+)
+_DEMO_INVOICE_TEXT = (
+    "Invoice {invoice}\nLoad: {load_id}\nBroker: {broker}\n"
+    "Amount Due: {total_usd}\n"
+    "Ticket Review: approved for billing pipeline.\n"
+    "Generated by SHAMS demo pack."
+)
+_DEMO_BOL_TEXT = (
+    "Bill of Lading {bol}\nLoad: {load_id}\nPRO: {pro}\n"
+    "Driver: {driver_name}\n"
+    "Equipment: {equipment}\n"
+    "Shipper: {customer}\nConsignee: {delivery}\n"
+    "Weight: 42000 lb\n"
+)
+_DEMO_POD_TEXT = (
+    "Proof of Delivery\nLoad: {load_id}\nPRO: {pro}\nBOL: {bol}\n"
+    "Delivered to: {customer}\nSigned by: Dock Supervisor\nCondition: Good\n"
+)
+_DEMO_LUMPER_TEXT = (
+    "Lumper Receipt LMP-{numeric:06d}\nLoad: {load_id}\nPRO: {pro}\n"
+    "Service: Unloading\nTotal fee: $165.00\n"
+)
+
+
+_DemoDocument = tuple[DocumentType, str, Dict[str, Any], str]
+
+
+def _demo_rate_confirmation(fields: Dict[str, Any]) -> _DemoDocument:
+    return (
+        DocumentType.RATE_CONFIRMATION,
+        f"RateConf_{fields['rate_conf']}_{fields['broker']}.pdf",
+        {
+            "load_number": fields["load_id"],
+            "broker_name": fields["broker"],
+            "rate_conf_number": fields["rate_conf"],
+            "rate": fields["total_rate"],
+            "rate_per_mile": fields["rate_per_mile"],
+            "miles": fields["miles"],
+            "pickup_location": fields["pickup"],
+            "delivery_location": fields["delivery"],
+            "equipment_type": fields["equipment"],
+        },
+        _DEMO_RATE_CONF_TEXT.format_map(fields),
+    )
+
+
+def _demo_invoice(fields: Dict[str, Any]) -> _DemoDocument:
+    return (
+        DocumentType.INVOICE,
+        f"Invoice_{fields['invoice']}_{fields['broker']}.pdf",
+        {
+            "invoice_number": fields["invoice"],
+            "load_number": fields["load_id"],
+            "broker_name": fields["broker"],
+            "total_amount": fields["total_rate"],
+        },
+        _DEMO_INVOICE_TEXT.format_map(fields),
+    )
+
+
+def _demo_bill_of_lading(fields: Dict[str, Any]) -> _DemoDocument:
+    return (
+        DocumentType.BOL,
+        f"BOL_{fields['bol']}_{fields['load_id']}.pdf",
+        {
+            "bol_number": fields["bol"],
+            "load_number": fields["load_id"],
+            "pro_number": fields["pro"],
+            "driver_name": fields["driver_name"],
+            "equipment_type": fields["equipment"],
+            "weight": "42000 lb",
+            "reference_number": f"REF-{fields['numeric']:06d}",
+        },
+        _DEMO_BOL_TEXT.format_map(fields),
+    )
+
+
+def _demo_proof_of_delivery(fields: Dict[str, Any]) -> _DemoDocument:
+    return (
+        DocumentType.POD,
+        f"POD_{fields['pro']}_{fields['load_id']}.pdf",
+        {
+            "load_number": fields["load_id"],
+            "pro_number": fields["pro"],
+            "bol_number": fields["bol"],
+            "delivered_to": fields["customer"],
+            "signed_for_by": "Dock Supervisor",
+            "delivery_date": "2026-02-16",
+        },
+        _DEMO_POD_TEXT.format_map(fields),
+    )
+
+
+def _demo_lumper_receipt(fields: Dict[str, Any]) -> _DemoDocument:
+    return (
+        DocumentType.LUMPER_RECEIPT,
+        f"Lumper_{fields['load_id']}_{fields['numeric']:06d}.pdf",
+        {
+            "receipt_number": f"LMP-{fields['numeric']:06d}",
+            "load_number": fields["load_id"],
+            "pro_number": fields["pro"],
+            "total_fee": 165.0,
+        },
+        _DEMO_LUMPER_TEXT.format_map(fields),
+    )
+
+
+# Demo-pack documents in pack order; a pack of N documents per load uses the first N builders.
+_DEMO_PACK_BUILDERS = (
+    _demo_rate_confirmation,
+    _demo_invoice,
+    _demo_bill_of_lading,
+    _demo_proof_of_delivery,
+    _demo_lumper_receipt,
+)
+
+
+@lru_cache(maxsize=8192)
+def _format_usd(value: float) -> str:
+    # Seeded and extracted amounts are rounded to cents, so the same values recur across loads.
+    return f"${value:,.2f}"
+
+
+async def _embed_in_windows(texts: list[str]) -> list[list[float]]:
+    """Embed ``texts`` in fixed-size requests with a bounded number in flight, preserving order."""
+    gate = asyncio.Semaphore(_EMBED_CONCURRENCY)
+
+    async def embed(window: list[str]) -> list[list[float]]:
+        async with gate:
+            return await embedding_service.embed_batch(window)
+
+    windows = [texts[start: start + _EMBED_BATCH] for start in range(0, len(texts), _EMBED_BATCH)]
+    batches = await asyncio.gather(*(embed(window) for window in windows))
+    return [vector for batch in batches for vector in batch]
+
+
+def _utc_stamp() -> str:
+    return "%04d-%02d-%02dT%02d:%02d:%02dZ" % time.gmtime()[:6]
+
+
+_NAME_SEPARATORS = re.compile(r"[^a-z0-9 ]")
+_TOKEN_NOISE = re.compile(r"[^A-Z0-9]")
+
+
+@lru_cache(maxsize=1024)
+def _name_tokens(text: str) -> tuple[str, tuple[str, ...]]:
+    """Lower-cased text with punctuation blanked, plus its tokens longer than one character."""
+    normalized = _NAME_SEPARATORS.sub(" ", text.lower())
+    return normalized, tuple(token for token in normalized.split() if len(token) > 1)
+
+
+@dataclass(slots=True)
+class _ReviewPayload:
+    """Internal ticket review record; the pydantic result is built only at the API boundary."""
+
+    review_id: str
+    load_id: str
+    ticket_number: Optional[str]
+    status: TicketStatus
+    auto_approved: bool
+    approval_reason: str
+    final_confidence: float
+    confidence_profile: List[ConfidenceField]
+    rules: List[RuleResult]
+    failed_rules: List[str]
+    leakage_findings: List[str]
+    billing_ready: bool
+    processing_time_ms: float
+    documents_used: List[str]
+    missing_documents: List[str]
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    def to_storage(self) -> Dict[str, Any]:
+        """JSON-ready dict matching ``TicketReviewResult.model_dump(mode="json")``."""
+        return {
+            "review_id": self.review_id,
+            "load_id": self.load_id,
+            "ticket_number": self.ticket_number,
+            "status": self.status.value,
+            "auto_approved": self.auto_approved,
+            "approval_reason": self.approval_reason,
+            "final_confidence": self.final_confidence,
+            "confidence_profile": [row.model_dump(mode="json") for row in self.confidence_profile],
+            "rules": [row.model_dump(mode="json") for row in self.rules],
+            "failed_rules": self.failed_rules,
+            "leakage_findings": self.leakage_findings,
+            "billing_ready": self.billing_ready,
+            "processing_time_ms": self.processing_time_ms,
+            "documents_used": self.documents_used,
+            "missing_documents": self.missing_documents,
+            "created_at": self.created_at.isoformat().replace("+00:00", "Z"),
+        }
+
+    def to_result(self) -> TicketReviewResult:
+        # Every field was produced by the engine itself, so validation is skipped.
+        return TicketReviewResult.model_construct(
+            **{name: getattr(self, name) for name in self.__slots__}
+        )
+
+
+@dataclass
+class _CopilotContext:
+    """Per-query snapshot of dispatch state shared by the copilot intent branches."""
+
+    tenant_id: str
+    board: Dict[str, Any]
+    loads: List[Dict[str, Any]]
+    drivers: List[Dict[str, Any]]
+    load_lookup: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    active_load_ids: frozenset[str] = frozenset()
+
+    @cached_property
+    def reviews(self) -> List[Dict[str, Any]]:
+        return ops_state_store.list_reviews(self.tenant_id)
+
+    @cached_property
+    def latest_review_by_load(self) -> Dict[str, Dict[str, Any]]:
+        # Reviews arrive newest-first; only in-progress loads are ever looked up,
+        # so closed/archived reviews are dropped before indexing.
+        latest: Dict[str, Dict[str, Any]] = {}
+        active = self.active_load_ids
+        for row in self.reviews:
+            load_id = str(row.get("load_id") or "")
+            if load_id in active and load_id not in latest:
+                latest[load_id] = row
+        return latest
+
+    @cached_property
+    def load_buckets(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Loads split by status in one pass; each bucket keeps board order."""
+        buckets: Dict[str, List[Dict[str, Any]]] = {"planned": [], "in_progress": [], "active": [], "delivered": []}
+        for row in self.loads:
+            status = row.get("status")
+            if status == LoadStatus.DELIVERED.value:
+                buckets["delivered"].append(row)
+                continue
+            buckets["active"].append(row)
+            if status == LoadStatus.PLANNED.value:
+                buckets["planned"].append(row)
+            elif status in _IN_PROGRESS_STATUSES:
+                buckets["in_progress"].append(row)
+        return buckets
+
+    @cached_property
+    def driver_buckets(self) -> Dict[str, List[Dict[str, Any]]]:
+        buckets: Dict[str, List[Dict[str, Any]]] = {"available": [], "assigned": []}
+        for driver in self.drivers:
+            status = driver.get("status")
+            if status in buckets:
+                buckets[status].append(driver)
+        return buckets
+
+    @cached_property
+    def driver_first_names(self) -> frozenset[str]:
+        return frozenset(str(driver.get("name", "")).split(" ")[0].lower() for driver in self.drivers)
+
+
+@dataclass(slots=True)
+class _CopilotTurn:
+    """One copilot query as seen by the intent handlers."""
+
+    query: str
+    intents: frozenset[str]
+    started: float
+    ctx: _CopilotContext
+    resolved_load_id: Optional[str] = None
+    ticket_ref: Optional[str] = None
+
+
 class OpsEngine:
     """Business orchestration layer for the SHAMS autonomous MVP."""
 
     TICKET_PATTERN = re.compile(r"\b(?:ticket|tkt|tk)\b\s*#?\s*[:\-]?\s*([A-Z0-9\-]{5,})\b", re.IGNORECASE)
+    TICKET_COMPACT_PATTERN = re.compile(r"\bTKT[-_ ]?(\d{5,})\b", re.IGNORECASE)
     LOAD_ID_PATTERN = re.compile(r"\bLOAD[-_ ]?(\d{3,}[A-Z0-9]*)\b", re.IGNORECASE)
+    LOAD_SUFFIX_PATTERN = re.compile(r"0*(\d+)([A-Z0-9]*)")
     GREETING_PATTERN = re.compile(r"^\s*(hi|hello|hey|yo|sup|good (morning|afternoon|evening))[\s!.?]*$", re.IGNORECASE)
     ALLOWED_STATUS_TRANSITIONS = {
         LoadStatus.PLANNED.value: {LoadStatus.ASSIGNED.value, LoadStatus.BLOCKED.value},
@@ -66,6 +466,9 @@ class OpsEngine:
     def __init__(self) -> None:
         self.settings = get_settings()
         self._free_roam_agent = FreeRoamAgent(self)
+        self._dispatch_board_cache: Dict[tuple[str, Optional[str]], tuple[int, Dict[str, Any]]] = {}
+        self._dispatch_board_lock = Lock()
+        self._system_context_cache: Dict[str, tuple[int, str]] = {}
 
     def free_roam_ready(self) -> bool:
         return self._free_roam_agent.is_enabled()
@@ -139,7 +542,7 @@ class OpsEngine:
             )
             patch["status"] = requested_status
         existing.update(patch)
-        existing["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        existing["updated_at"] = _utc_stamp()
         existing["version"] = current_version + 1
         row = ops_state_store.upsert_load(tenant_id, LoadRecord(**existing))
         ops_state_store.record_timeline_event(
@@ -207,7 +610,7 @@ class OpsEngine:
         self._validate_status_transition(current_status, next_status)
 
         existing["status"] = next_status
-        existing["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        existing["updated_at"] = _utc_stamp()
         existing["version"] = current_version + 1
         row = ops_state_store.upsert_load(tenant_id, LoadRecord(**existing))
         ops_state_store.record_timeline_event(
@@ -224,13 +627,25 @@ class OpsEngine:
         return row
 
     def dispatch_board(self, tenant_id: str, status: Optional[LoadStatus] = None) -> Dict[str, Any]:
+        # Boards are memoized against the store's write counter; rows are shared and
+        # must be treated as read-only by callers.
+        cache_key = (tenant_id, status.value if isinstance(status, LoadStatus) else status)
+        version = ops_state_store.version(tenant_id)
+        with self._dispatch_board_lock:
+            cached = self._dispatch_board_cache.get(cache_key)
+        if cached and cached[0] == version:
+            return dict(cached[1])
+
         loads = ops_state_store.list_loads(tenant_id, status=status)
         metrics = ops_state_store.metrics_snapshot(tenant_id)
-        return {
+        board = {
             "counts_by_status": metrics.get("counts_by_status", {}),
             "loads": loads,
             "drivers": ops_state_store.list_drivers(tenant_id),
         }
+        with self._dispatch_board_lock:
+            self._dispatch_board_cache[cache_key] = (version, board)
+        return dict(board)
 
     def dispatch_send(self, tenant_id: str, load_id: str, actor: str) -> Dict[str, Any]:
         normalized = str(load_id or "").strip().upper()
@@ -320,14 +735,20 @@ class OpsEngine:
                 return value
         return None
 
-    def _collect_doc_facts(self, load_id: str, docs: List[Dict[str, Any]], request: TicketReviewRequest) -> Dict[str, Any]:
+    def _collect_doc_facts(
+        self,
+        load_id: str,
+        docs: List[Dict[str, Any]],
+        request: TicketReviewRequest,
+        gps_override: Optional[float] = None,
+    ) -> Dict[str, Any]:
         facts: Dict[str, Any] = {
             "load_id": load_id,
             "ticket_number": self._find_ticket_number(docs, request.ticket_number),
             "customer": None,
             "broker": None,
             "rated_miles": request.rated_miles,
-            "gps_miles": request.gps_miles,
+            "gps_miles": request.gps_miles if gps_override is None else gps_override,
             "zone": request.zone,
             "rate_total": request.expected_rate,
             "signed_for_by": None,
@@ -361,10 +782,12 @@ class OpsEngine:
         return facts
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def _normalize_token(value: Any) -> str:
-        return re.sub(r"[^A-Z0-9]", "", str(value or "").upper())
+        return _TOKEN_NOISE.sub("", str(value or "").upper())
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _normalize_query_for_intents(value: str) -> str:
         text = str(value or "").lower()
         replacements = {
@@ -388,18 +811,26 @@ class OpsEngine:
             normalized = self._normalize_token(match.group(1))
             if normalized and any(ch.isdigit() for ch in normalized):
                 return normalized
-        compact_match = re.search(r"\bTKT[-_ ]?(\d{5,})\b", raw, re.IGNORECASE)
+        compact_match = self.TICKET_COMPACT_PATTERN.search(raw)
         if compact_match:
             return self._normalize_token(compact_match.group(1))
         return None
 
+    @staticmethod
+    def _extracted_field(doc: Optional[Dict[str, Any]], key: str) -> Any:
+        if not doc:
+            return None
+        extracted = doc.get("extracted_data")
+        return extracted.get(key) if extracted else None
+
     @staticmethod
     def _safe_rows(rows: Any) -> List[Dict[str, Any]]:
         if not isinstance(rows, list):
             return []
         return [row for row in rows if isinstance(row, dict)]
 
-    def _normalize_load_id(self, value: Any) -> Optional[str]:
+    @classmethod
+    def _normalize_load_id(cls, value: Any) -> Optional[str]:
         cleaned = str(value or "").strip().upper().replace("-", "").replace("_", "")
         if not cleaned:
             return None
@@ -407,7 +838,7 @@ class OpsEngine:
         if not suffix:
             return None
 
-        numeric_match = re.fullmatch(r"0*(\d+)([A-Z0-9]*)", suffix)
+        numeric_match = cls.LOAD_SUFFIX_PATTERN.fullmatch(suffix)
         if numeric_match:
             digits = str(int(numeric_match.group(1)))
             tail = numeric_match.group(2)
@@ -429,36 +860,41 @@ class OpsEngine:
         if not drivers:
             return None
 
-        query_norm = re.sub(r"[^a-z0-9 ]", " ", str(query or "").lower())
-        query_tokens = [token for token in query_norm.split() if len(token) > 1]
-        best: Optional[Dict[str, Any]] = None
-        best_score = 0.0
-
+        query_norm, query_tokens = _name_tokens(str(query or ""))
+        named: list[tuple[Dict[str, Any], str, tuple[str, ...]]] = []
         for driver in drivers:
-            name = str(driver.get("name") or "").strip()
-            if not name:
-                continue
-            name_norm = re.sub(r"[^a-z0-9 ]", " ", name.lower())
-            name_tokens = [token for token in name_norm.split() if len(token) > 1]
-            if not name_tokens:
-                continue
+            name_norm, name_tokens = _name_tokens(str(driver.get("name") or "").strip())
+            if name_tokens:
+                named.append((driver, name_norm, name_tokens))
 
-            score = 0.0
+        # A full-name hit (1.0) or a first-name token hit (0.88) outranks every fuzzy
+        # score, so the first driver with either wins without running SequenceMatcher.
+        for driver, name_norm, _ in named:
             if name_norm in query_norm:
-                score = 1.0
-            else:
-                if name_tokens[0] in query_tokens:
-                    score = max(score, 0.88)
-                for n_token in name_tokens:
-                    if n_token in query_tokens:
-                        score = max(score, 0.82)
+                return driver
+        query_token_set = frozenset(query_tokens)
+        for driver, _, name_tokens in named:
+            if name_tokens[0] in query_token_set:
+                return driver
+
+        best: Optional[Dict[str, Any]] = None
+        best_score = 0.0
+        for driver, _, name_tokens in named:
+            score = 0.0
+            for n_token in name_tokens:
+                if n_token in query_token_set:
+                    score = max(score, 0.82)
+                    continue
+                for q_token in query_tokens:
+                    matcher = SequenceMatcher(None, q_token, n_token)
+                    # Cheap upper bounds first; most token pairs cannot reach 0.84.
+                    if matcher.real_quick_ratio() < 0.84 or matcher.quick_ratio() < 0.84:
                         continue
-                    for q_token in query_tokens:
-                        ratio = SequenceMatcher(None, q_token, n_token).ratio()
-                        if ratio >= 0.9:
-                            score = max(score, 0.8)
-                        elif ratio >= 0.84:
-                            score = max(score, 0.74)
+                    ratio = matcher.ratio()
+                    if ratio >= 0.9:
+                        score = max(score, 0.8)
+                    elif ratio >= 0.84:
+                        score = max(score, 0.74)
             if score > best_score:
                 best = driver
                 best_score = score
@@ -724,33 +1160,35 @@ class OpsEngine:
 
         return True, "Auto-approved: confidence and validation thresholds passed"
 
-    def _review_ticket_core(self, request: TicketReviewRequest, tenant_id: str, actor: str) -> TicketReviewResult:
+    def _review_ticket_core(
+        self,
+        request: TicketReviewRequest,
+        tenant_id: str,
+        actor: str,
+        load: Optional[Dict[str, Any]] = None,
+    ) -> _ReviewPayload:
         started = time.perf_counter()
-        load = ops_state_store.get_load(tenant_id, request.load_id)
+        if load is None:
+            load = ops_state_store.get_load(tenant_id, request.load_id)
         if not load:
             raise KeyError(f"Load not found: {request.load_id}")
 
-        docs = []
         if request.document_ids:
-            for doc_id in request.document_ids:
-                row = document_registry.get(doc_id, tenant_id=tenant_id)
-                if row:
-                    docs.append(row)
+            docs = document_registry.get_many(request.document_ids, tenant_id=tenant_id)
         else:
             docs = document_registry.find_related(request.load_id, tenant_id=tenant_id)
 
         # Prefer explicit GPS miles from request; otherwise use the latest synced
         # telemetry event for this load within the configured lookback window.
-        if request.gps_miles is None:
-            telemetry_miles = ops_state_store.latest_samsara_miles(
+        effective_gps_miles = request.gps_miles
+        if effective_gps_miles is None:
+            effective_gps_miles = ops_state_store.latest_samsara_miles(
                 tenant_id=tenant_id,
                 load_id=request.load_id,
                 hours_back=request.gps_hours_back,
             )
-            if telemetry_miles is not None:
-                request = request.model_copy(update={"gps_miles": telemetry_miles})
 
-        facts = self._collect_doc_facts(request.load_id, docs, request)
+        facts = self._collect_doc_facts(request.load_id, docs, request, gps_override=effective_gps_miles)
         confidence_profile = self._confidence_profile(facts, docs, load)
         rules, leakage_findings, missing_docs = self._rule_results(facts, load, docs)
         auto_approved, reason = self._is_auto_approved(confidence_profile, rules)
@@ -763,7 +1201,7 @@ class OpsEngine:
         review_id = f"REV-{ops_state_store.next_sequence(tenant_id, 'review'):06d}"
         processing_time_ms = round((time.perf_counter() - started) * 1000, 2)
 
-        result = TicketReviewResult(
+        result = _ReviewPayload(
             review_id=review_id,
             load_id=request.load_id,
             ticket_number=facts.get("ticket_number"),
@@ -781,20 +1219,20 @@ class OpsEngine:
             missing_documents=missing_docs,
         )
 
-        payload = result.model_dump(mode="json")
-        ops_state_store.store_review(tenant_id, payload)
-        ops_state_store.record_timeline_event(
-            tenant_id,
-            request.load_id,
-            event_type="ticket_reviewed",
-            actor=actor,
-            details={
-                "review_id": review_id,
-                "auto_approved": auto_approved,
-                "status": status.value,
-                "latency_ms": processing_time_ms,
-            },
-        )
+        ops_state_store.store_review(tenant_id, result.to_storage())
+        timeline_events: list[Dict[str, Any]] = [
+            {
+                "load_id": request.load_id,
+                "event_type": "ticket_reviewed",
+                "actor": actor,
+                "details": {
+                    "review_id": review_id,
+                    "auto_approved": auto_approved,
+                    "status": status.value,
+                    "latency_ms": processing_time_ms,
+                },
+            }
+        ]
 
         if auto_approved:
             self._mark_load_complete_for_ticket(
@@ -802,12 +1240,15 @@ class OpsEngine:
                 load_id=request.load_id,
                 actor=actor,
                 reason="ticket_auto_approved",
+                timeline_events=timeline_events,
             )
+        ops_state_store.record_timeline_events_bulk(tenant_id, timeline_events)
 
         return result
 
     async def review_ticket(self, request: TicketReviewRequest, tenant_id: str, actor: str) -> TicketReviewResult:
-        return self._review_ticket_core(request=request, tenant_id=tenant_id, actor=actor)
+        result = await asyncio.to_thread(self._review_ticket_core, request=request, tenant_id=tenant_id, actor=actor)
+        return result.to_result()
 
     def ticket_queue(self, tenant_id: str, status: Optional[str] = None) -> List[Dict[str, Any]]:
         return ops_state_store.list_reviews(tenant_id, status=status)
@@ -817,7 +1258,7 @@ class OpsEngine:
         if not load:
             raise KeyError(load_id)
 
-        reviews = [row for row in ops_state_store.list_reviews(tenant_id) if str(row.get("load_id")) == load_id]
+        reviews = ops_state_store.reviews_for_load(tenant_id, load_id)
         latest_review = reviews[0] if reviews else None
         billing_rows = [row for row in ops_state_store.list_billing(tenant_id) if str(row.get("load_id")) == load_id]
         billing = billing_rows[0] if billing_rows else None
@@ -879,7 +1320,7 @@ class OpsEngine:
         if not load:
             raise KeyError(load_id)
 
-        related_reviews = [row for row in ops_state_store.list_reviews(tenant_id) if row.get("load_id") == load_id]
+        related_reviews = ops_state_store.reviews_for_load(tenant_id, load_id)
         latest_review = related_reviews[0] if related_reviews else None
         billing_rows = [row for row in ops_state_store.list_billing(tenant_id) if row.get("load_id") == load_id]
         billing = billing_rows[0] if billing_rows else {}
@@ -960,6 +1401,7 @@ class OpsEngine:
 
     def sync_samsara(self, request: SamsaraSyncRequest, tenant_id: str, actor: str) -> Dict[str, Any]:
         synced: List[Dict[str, Any]] = []
+        timeline_events: List[Dict[str, Any]] = []
         unmatched = 0
         load_ids = request.load_ids or [row.get("load_id") for row in ops_state_store.list_loads(tenant_id)[:30]]
         if not load_ids:
@@ -1002,14 +1444,9 @@ class OpsEngine:
                 "source": "samsara_live",
             }
             synced.append(trip)
-            ops_state_store.record_timeline_event(
-                tenant_id,
-                load_id,
-                event_type="samsara_synced",
-                actor=actor,
-                details=trip,
-            )
+            timeline_events.append({"load_id": load_id, "event_type": "samsara_synced", "actor": actor, "details": trip})
 
+        ops_state_store.record_timeline_events_bulk(tenant_id, timeline_events)
         return {
             "synced": len(synced),
             "hours_back": request.hours_back,
@@ -1019,6 +1456,13 @@ class OpsEngine:
         }
 
     def _build_system_context(self, tenant_id: str) -> str:
+        # Memoized against the store's write counter, like the dispatch board it summarizes.
+        version = ops_state_store.version(tenant_id)
+        with self._dispatch_board_lock:
+            cached = self._system_context_cache.get(tenant_id)
+        if cached and cached[0] == version:
+            return cached[1]
+
         board = self.dispatch_board(tenant_id)
         loads = board.get("loads", [])
         drivers = board.get("drivers", [])
@@ -1028,10 +1472,11 @@ class OpsEngine:
         if not drivers:
             driver_summary.append("No drivers found.")
         else:
-            by_status: dict[str, list[str]] = {}
+            by_status: defaultdict[str, list[str]] = defaultdict(list)
             for driver in drivers:
-                status = str(driver.get("status", "unknown")).lower()
-                by_status.setdefault(status, []).append(f"{driver.get('name')} ({driver.get('truck_id', '-')})")
+                status = driver.get("status", "unknown")
+                label = driver.get("driver_label") or f"{driver.get('name')} ({driver.get('truck_id', '-')})"
+                by_status[status].append(label)
             for status, names in by_status.items():
                 driver_summary.append(f"- {status.title()}: {', '.join(names)}")
 
@@ -1052,42 +1497,52 @@ class OpsEngine:
             f"Billing Ready: {int((billing_stats.get('billing_ready_rate', 0) or 0) * 100)}%, "
             f"Recovered: ${int(billing_stats.get('estimated_leakage_recovered_usd', 0) or 0)}"
         )
-        return (
+        context = (
             "CURRENT SYSTEM STATE (Live Data):\n"
             f"Drivers:\n{chr(10).join(driver_summary)}\n\n"
             f"Dispatch:\n{chr(10).join(load_summary)}\n\n"
             f"Metrics: {billing_summary}\n"
         )
+        with self._dispatch_board_lock:
+            self._system_context_cache[tenant_id] = (version, context)
+        return context
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _scan_query(cls, query: str) -> tuple[str, tuple[str, ...]]:
+        """Intent-normalized text plus every load id mentioned, memoized per query string."""
+        found: list[str] = []
+        seen: set[str] = set()
+        for match in cls.LOAD_ID_PATTERN.finditer(query):
+            normalized = cls._normalize_load_id(f"LOAD{match.group(1)}")
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                found.append(normalized)
+        return cls._normalize_query_for_intents(query), tuple(found)
 
     def _extract_load_id(self, query: str, explicit: Optional[str] = None) -> Optional[str]:
         if explicit and explicit.strip():
             return self._normalize_load_id(explicit)
-        match = self.LOAD_ID_PATTERN.search(query or "")
-        if not match:
-            return None
-        return self._normalize_load_id(f"LOAD{match.group(1)}")
+        load_ids = self._scan_query(query or "")[1]
+        return load_ids[0] if load_ids else None
 
     def _extract_load_ids(self, query: str) -> List[str]:
-        found: list[str] = []
-        for match in self.LOAD_ID_PATTERN.finditer(query or ""):
-            normalized = self._normalize_load_id(f"LOAD{match.group(1)}")
-            if normalized and normalized not in found:
-                found.append(normalized)
-        return found
+        return list(self._scan_query(query or "")[1])
 
     def _release_drivers_from_completed_reviews(self, tenant_id: str, actor: str = "copilot") -> int:
         reviews = ops_state_store.list_reviews(tenant_id)
         cleared_loads = {
-            str(row.get("load_id")): str(row.get("status", "")).lower()
+            str(row.get("load_id")): row.get("status")
             for row in reviews
-            if str(row.get("status", "")).lower() in {TicketStatus.APPROVED.value, TicketStatus.RESOLVED.value}
+            if row.get("status") in _CLEARED_TICKET_STATUSES
         }
         released_drivers: set[str] = set()
+        timeline_events: list[Dict[str, Any]] = []
         for load in ops_state_store.list_loads(tenant_id):
             load_id = str(load.get("load_id") or "")
             if not load_id:
                 continue
-            if str(load.get("status", "")).lower() not in {LoadStatus.ASSIGNED.value, LoadStatus.EN_ROUTE.value}:
+            if load.get("status") not in _IN_PROGRESS_STATUSES:
                 continue
             if load_id not in cleared_loads:
                 continue
@@ -1099,16 +1554,28 @@ class OpsEngine:
                 continue
             ops_state_store.set_driver_status(tenant_id, driver_id, "available")
             released_drivers.add(driver_id)
-            ops_state_store.record_timeline_event(
-                tenant_id,
-                load_id,
-                event_type="driver_released",
-                actor=actor,
-                details={"driver_id": driver_id, "reason": "ticket_cleared"},
+            timeline_events.append(
+                {
+                    "load_id": load_id,
+                    "event_type": "driver_released",
+                    "actor": actor,
+                    "details": {"driver_id": driver_id, "reason": "ticket_cleared"},
+                }
             )
+        ops_state_store.record_timeline_events_bulk(tenant_id, timeline_events)
         return len(released_drivers)
 
-    def _mark_load_complete_for_ticket(self, tenant_id: str, load_id: str, actor: str, reason: str) -> None:
+    def _mark_load_complete_for_ticket(
+        self,
+        tenant_id: str,
+        load_id: str,
+        actor: str,
+        reason: str,
+        timeline_events: Optional[list[Dict[str, Any]]] = None,
+        now_iso: Optional[str] = None,
+    ) -> None:
+        # Callers batching several writes pass their own list and flush it once.
+        pending: list[Dict[str, Any]] = timeline_events if timeline_events is not None else []
         load = ops_state_store.get_load(tenant_id, load_id)
         if not load:
             return
@@ -1116,33 +1583,37 @@ class OpsEngine:
         current_status = self._normalize_status(load.get("status", LoadStatus.PLANNED.value))
         if current_status != LoadStatus.DELIVERED.value:
             load["status"] = LoadStatus.DELIVERED.value
-            load["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            load["updated_at"] = now_iso or _utc_stamp()
             load["version"] = int(load.get("version") or 1) + 1
             ops_state_store.upsert_load(tenant_id, LoadRecord(**load))
-            ops_state_store.record_timeline_event(
-                tenant_id,
-                load_id,
-                event_type="load_status_transition",
-                actor=actor,
-                details={
-                    "from_status": current_status,
-                    "to_status": LoadStatus.DELIVERED.value,
-                    "reason": reason,
-                    "version": load.get("version"),
-                },
+            pending.append(
+                {
+                    "load_id": load_id,
+                    "event_type": "load_status_transition",
+                    "actor": actor,
+                    "details": {
+                        "from_status": current_status,
+                        "to_status": LoadStatus.DELIVERED.value,
+                        "reason": reason,
+                        "version": load.get("version"),
+                    },
+                }
             )
 
         assignment = load.get("assignment") or {}
         driver_id = assignment.get("driver_id")
         if driver_id:
             ops_state_store.set_driver_status(tenant_id, driver_id, "available")
-            ops_state_store.record_timeline_event(
-                tenant_id,
-                load_id,
-                event_type="driver_released",
-                actor=actor,
-                details={"driver_id": driver_id, "reason": reason},
+            pending.append(
+                {
+                    "load_id": load_id,
+                    "event_type": "driver_released",
+                    "actor": actor,
+                    "details": {"driver_id": driver_id, "reason": reason},
+                }
             )
+        if timeline_events is None:
+            ops_state_store.record_timeline_events_bulk(tenant_id, pending)
 
     def _auto_assign_planned_loads(
         self,
@@ -1153,23 +1624,23 @@ class OpsEngine:
         assigned = 0
         errors: list[str] = []
         assignments: list[Dict[str, Any]] = []
-        planned = [
-            row for row in ops_state_store.list_loads(tenant_id)
-            if str(row.get("status", "")).lower() == LoadStatus.PLANNED.value and not row.get("assignment")
-        ]
+        timeline_events: list[Dict[str, Any]] = []
+        planned = ops_state_store.list_loads(tenant_id, status=LoadStatus.PLANNED, unassigned_only=True)
+        # auto_assign_load always prefers an available driver, so each successful
+        # assignment consumes exactly one slot from this count.
+        available_count = sum(
+            1 for d in ops_state_store.list_drivers(tenant_id) if d.get("status") == "available"
+        )
         for row in planned[: max(1, limit)]:
             load_id = str(row.get("load_id") or "")
             if not load_id:
                 continue
-            available = [
-                d for d in ops_state_store.list_drivers(tenant_id)
-                if str(d.get("status", "")).lower() == "available"
-            ]
-            if not available:
+            if available_count <= 0:
                 break
             try:
                 assignment = ops_state_store.auto_assign_load(tenant_id, load_id)
                 assigned += 1
+                available_count -= 1
                 assignments.append(
                     {
                         "load_id": load_id,
@@ -1178,16 +1649,18 @@ class OpsEngine:
                         "truck_id": assignment.get("truck_id"),
                     }
                 )
-                ops_state_store.record_timeline_event(
-                    tenant_id,
-                    load_id,
-                    event_type="load_assigned",
-                    actor=actor,
-                    details={"mode": "copilot_auto_assign", **assignment},
+                timeline_events.append(
+                    {
+                        "load_id": load_id,
+                        "event_type": "load_assigned",
+                        "actor": actor,
+                        "details": {"mode": "copilot_auto_assign", **assignment},
+                    }
                 )
             except Exception as exc:
                 errors.append(f"{load_id}: {exc}")
                 break
+        ops_state_store.record_timeline_events_bulk(tenant_id, timeline_events)
         return assigned, errors, assignments
 
     def _run_quick_ticket_review(self, tenant_id: str, load_id: str, actor: str = "copilot") -> Optional[Dict[str, Any]]:
@@ -1206,6 +1679,7 @@ class OpsEngine:
                 ),
                 tenant_id=tenant_id,
                 actor=actor,
+                load=load,
             )
         except Exception:
             return None
@@ -1218,749 +1692,760 @@ class OpsEngine:
 
     def _finalize_approved_assigned_loads(self, tenant_id: str, actor: str = "copilot") -> list[str]:
         approved_by_load: Dict[str, Dict[str, Any]] = {}
-        for review in ops_state_store.list_reviews(tenant_id):
-            status = str(review.get("status", "")).lower()
-            if status not in {TicketStatus.APPROVED.value, TicketStatus.RESOLVED.value}:
-                continue
-            load_id = str(review.get("load_id") or "")
-            if load_id and load_id not in approved_by_load:
-                approved_by_load[load_id] = review
+        for review in ops_state_store.iter_reviews(tenant_id, status_in=_CLEARED_TICKET_STATUSES):
+            approved_by_load.setdefault(str(review.get("load_id") or ""), review)
+        approved_by_load.pop("", None)
 
         finalized: list[str] = []
-        for load in ops_state_store.list_loads(tenant_id):
+        timeline_events: list[Dict[str, Any]] = []
+        now_iso = _utc_stamp()
+        for load in ops_state_store.list_loads(tenant_id, status_in=_IN_PROGRESS_STATUSES):
             load_id = str(load.get("load_id") or "")
             if not load_id or load_id not in approved_by_load:
                 continue
-            if str(load.get("status", "")).lower() not in {LoadStatus.ASSIGNED.value, LoadStatus.EN_ROUTE.value}:
-                continue
-            self._mark_load_complete_for_ticket(tenant_id=tenant_id, load_id=load_id, actor=actor, reason="ticket_preapproved")
+            self._mark_load_complete_for_ticket(
+                tenant_id=tenant_id,
+                load_id=load_id,
+                actor=actor,
+                reason="ticket_preapproved",
+                timeline_events=timeline_events,
+                now_iso=now_iso,
+            )
             finalized.append(load_id)
+        ops_state_store.record_timeline_events_bulk(tenant_id, timeline_events)
         return finalized
 
+    def _build_context(self, tenant_id: str) -> _CopilotContext:
+        board = self.dispatch_board(tenant_id)
+        loads = self._safe_rows(board.get("loads"))
+        load_lookup: Dict[str, Dict[str, Any]] = {}
+        active_load_ids: set[str] = set()
+        for row in loads:
+            load_id = row.get("load_id")
+            if not load_id:
+                continue
+            load_id = str(load_id)
+            load_lookup[load_id] = row
+            if row.get("status") in _IN_PROGRESS_STATUSES:
+                active_load_ids.add(load_id)
+        return _CopilotContext(
+            tenant_id=tenant_id,
+            board=board,
+            loads=loads,
+            drivers=self._safe_rows(board.get("drivers")),
+            load_lookup=load_lookup,
+            active_load_ids=frozenset(active_load_ids),
+        )
+
+    @staticmethod
+    def _reply(
+        started: float,
+        answer: str,
+        *,
+        confidence: float,
+        source: str = "system_state",
+        document_type: str = "system_state",
+        route: str = "deterministic",
+    ) -> CopilotQueryResponse:
+        # Deterministic replies are assembled from engine-owned values, so validation is skipped.
+        return CopilotQueryResponse.model_construct(
+            answer=answer,
+            sources=[{"filename": source, "document_type": document_type, "similarity": 1.0}],
+            confidence=confidence,
+            processing_time_ms=(time.perf_counter() - started) * 1000,
+            route=route,
+        )
+
+    @staticmethod
+    def _review_confidence(review: Dict[str, Any]) -> float:
+        # Unscored stored reviews read as 0.9; answers quoting a review never report below 0.88.
+        return max(float(review.get("final_confidence") or 0.9), 0.88)
+
     def _try_ops_state_answer(
         self,
         query: str,
         tenant_id: str,
         started: float,
     ) -> CopilotQueryResponse | None:
-        q = self._normalize_query_for_intents((query or "").strip())
+        q, query_load_ids = self._scan_query((query or "").strip())
         if not q:
             return None
 
         if self.GREETING_PATTERN.match(q):
-            elapsed = (time.time() - started) * 1000
-            return CopilotQueryResponse(
-                answer=(
+            return self._reply(
+                started,
+                (
                     "Hey - I can help with live dispatch actions. Ask me things like: "
                     "'which drivers are available', 'assign next load', or "
                     "'who is the broker and invoice for LOAD00030'."
                 ),
-                sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
                 confidence=0.98,
-                processing_time_ms=elapsed,
             )
 
-        board = self.dispatch_board(tenant_id)
-        drivers = self._safe_rows(board.get("drivers"))
-        loads = self._safe_rows(board.get("loads"))
-        load_lookup = {str(row.get("load_id")): row for row in loads if row.get("load_id")}
-        load_id_from_query = self._extract_load_id(query)
-        resolved_load_id = self._resolve_load_id_from_lookup(load_id_from_query, load_lookup) or load_id_from_query
-
-        if any(token in q for token in ["why", "how come"]) and "complete" in q and "load" in q:
-            latest_review_by_load: Dict[str, Dict[str, Any]] = {}
-            for row in ops_state_store.list_reviews(tenant_id):
-                load_id = str(row.get("load_id") or "")
-                if load_id and load_id not in latest_review_by_load:
-                    latest_review_by_load[load_id] = row
-            not_complete = []
-            for row in loads:
-                if str(row.get("status", "")).lower() not in {LoadStatus.ASSIGNED.value, LoadStatus.EN_ROUTE.value}:
-                    continue
-                latest = latest_review_by_load.get(str(row.get("load_id") or ""))
-                status = str((latest or {}).get("status") or "pending_review").lower()
-                if status not in {TicketStatus.APPROVED.value, TicketStatus.RESOLVED.value}:
-                    not_complete.append((str(row.get("load_id") or ""), status))
-            elapsed = (time.time() - started) * 1000
-            if not not_complete:
-                return CopilotQueryResponse(
-                    answer=(
-                        "Loads move to complete only after ticket status is approved/resolved. "
-                        "Current assigned loads are already clear or waiting to sync."
-                    ),
-                    sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.93,
-                    processing_time_ms=elapsed,
-                )
-            preview = ", ".join(f"{load_id}({status})" for load_id, status in not_complete[:4])
-            return CopilotQueryResponse(
-                answer=(
-                    "Those loads did not move to complete because their latest ticket status is not approved/resolved yet. "
-                    f"Open items: {preview}."
-                ),
-                sources=[{"filename": "ticket_queue", "document_type": "system_state", "similarity": 1.0}],
-                confidence=0.95,
-                processing_time_ms=elapsed,
+        ctx = self._build_context(tenant_id)
+        if q.rstrip(" ?.!") in _DRIVER_LISTING_QUERIES:
+            return self._answer_driver_overview(
+                _CopilotTurn(query=query, intents=_query_intents(q), started=started, ctx=ctx)
             )
+        load_id_from_query = query_load_ids[0] if query_load_ids else None
+        resolved_load_id = self._resolve_load_id_from_lookup(load_id_from_query, ctx.load_lookup) or load_id_from_query
+
+        intents = _query_intents(q)
+        # Query facts that are not phrase groups join the intent set as extra signals,
+        # so every route below is a pair of set tests.
+        signals = set(intents)
+        if resolved_load_id:
+            signals.add("load_id")
+            if _DIRECT_ACTION_PATTERN.match(q):
+                signals.add("direct_action")
+        if any(name in q for name in ctx.driver_first_names):
+            signals.add("driver_named")
+        ticket_ref = self._extract_ticket_reference(query or "")
+        if ticket_ref:
+            signals.add("ticket_ref")
 
-        review_ticket_intent = (
-            any(token in q for token in ["review ticket", "ticket review", "run ticket review", "audit ticket", "run ticet review"])
-            and not any(token in q for token in ["why", "what is wrong"])
+        turn = _CopilotTurn(
+            query=query,
+            intents=intents,
+            started=started,
+            ctx=ctx,
+            resolved_load_id=resolved_load_id,
+            ticket_ref=ticket_ref,
         )
-        if review_ticket_intent:
-            elapsed = (time.time() - started) * 1000
-            target_load_id = resolved_load_id
-            if not target_load_id:
-                in_progress = [
-                    row for row in loads
-                    if str(row.get("status", "")).lower() in {LoadStatus.ASSIGNED.value, LoadStatus.EN_ROUTE.value}
-                ]
-                target_load_id = str(in_progress[0].get("load_id")) if in_progress else None
-            if not target_load_id:
-                planned_rows = [
-                    row for row in loads
-                    if str(row.get("status", "")).lower() == LoadStatus.PLANNED.value
-                ]
-                if planned_rows:
-                    target_load_id = str(planned_rows[0].get("load_id"))
-                    self.assign_load(
-                        LoadAssignmentRequest(load_id=target_load_id, auto=True),
-                        tenant_id=tenant_id,
-                        actor="copilot",
-                    )
-                    board = self.dispatch_board(tenant_id)
-                    loads = self._safe_rows(board.get("loads"))
-                    load_lookup = {str(row.get("load_id")): row for row in loads if row.get("load_id")}
-            if not target_load_id:
-                return CopilotQueryResponse(
-                    answer="No assigned loads are waiting for ticket review right now.",
-                    sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.92,
-                    processing_time_ms=elapsed,
-                )
-            target_load_id = self._resolve_load_id_from_lookup(target_load_id, load_lookup) or target_load_id
-            if target_load_id not in load_lookup:
-                return CopilotQueryResponse(
-                    answer=f"{target_load_id} is not in the current dispatch board.",
-                    sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.9,
-                    processing_time_ms=elapsed,
-                )
-            target = load_lookup[target_load_id]
-            reviewed = self._review_ticket_core(
-                TicketReviewRequest(
-                    load_id=target_load_id,
-                    ticket_number=f"TKT-AUTO-{int(time.time())}",
-                    rated_miles=float(target.get("planned_miles") or 0.0),
-                    gps_miles=round(float(target.get("planned_miles") or 0.0) * 1.01, 2),
-                    zone=target.get("zone"),
-                    expected_rate=float(target.get("rate_total") or 0.0),
-                ),
-                tenant_id=tenant_id,
-                actor="copilot",
-            )
-            if reviewed.status == TicketStatus.EXCEPTION:
-                return CopilotQueryResponse(
-                    answer=(
-                        f"Reviewed {target_load_id}: flagged {reviewed.ticket_number}. "
-                        f"Reason: {reviewed.approval_reason}."
-                    ),
-                    sources=[{"filename": reviewed.review_id, "document_type": "ticket_review", "similarity": 1.0}],
-                    confidence=max(float(reviewed.final_confidence), 0.88),
-                    processing_time_ms=(time.time() - started) * 1000,
-                )
-            return CopilotQueryResponse(
-                answer=(
-                    f"Reviewed {target_load_id}: approved {reviewed.ticket_number}. "
-                    "Load moved to complete and driver released."
+        for required, forbidden, handler in self._OPS_STATE_ROUTES:
+            if required <= signals and forbidden.isdisjoint(signals):
+                answer = handler(self, turn)
+                if answer is not None:
+                    return answer
+        return None
+
+    def _answer_why_not_complete(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        loads = ctx.loads
+        latest_review_by_load = ctx.latest_review_by_load
+        not_complete = []
+        for row in loads:
+            load_id = str(row.get("load_id") or "")
+            if load_id not in ctx.active_load_ids:
+                continue
+            latest = latest_review_by_load.get(load_id)
+            status = str((latest or {}).get("status") or "pending_review").lower()
+            if status not in _CLEARED_TICKET_STATUSES:
+                not_complete.append((load_id, status))
+        if not not_complete:
+            return self._reply(
+                started,
+                (
+                    "Loads move to complete only after ticket status is approved/resolved. "
+                    "Current assigned loads are already clear or waiting to sync."
                 ),
-                sources=[{"filename": reviewed.review_id, "document_type": "ticket_review", "similarity": 1.0}],
-                confidence=max(float(reviewed.final_confidence), 0.9),
-                processing_time_ms=(time.time() - started) * 1000,
+                confidence=0.93,
+                source="dispatch_board",
             )
-
-        driver_named_in_query = any(str(driver.get("name", "")).split(" ")[0].lower() in q for driver in drivers)
-        driver_activity_intent = (
-            any(token in q for token in ["loads did", "miles did", "how many miles", "how many loads", "which loads", "past week"])
-            and driver_named_in_query
+        preview = ", ".join(f"{load_id}({status})" for load_id, status in not_complete[:4])
+        return self._reply(
+            started,
+            (
+                "Those loads did not move to complete because their latest ticket status is not approved/resolved yet. "
+                f"Open items: {preview}."
+            ),
+            confidence=0.95,
+            source="ticket_queue",
         )
-        if driver_activity_intent:
-            elapsed = (time.time() - started) * 1000
-            driver = self._match_driver_from_query(query, drivers)
-            if not driver:
-                known = ", ".join(str(d.get("name") or "") for d in drivers[:6]) or "no drivers configured"
-                return CopilotQueryResponse(
-                    answer=f"I couldn't map that to a driver. Try one of: {known}.",
-                    sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.86,
-                    processing_time_ms=elapsed,
+
+    def _answer_review_ticket(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        tenant_id = ctx.tenant_id
+        resolved_load_id = turn.resolved_load_id
+        load_lookup = ctx.load_lookup
+        target_load_id = resolved_load_id
+        if not target_load_id:
+            in_progress = ctx.load_buckets["in_progress"]
+            target_load_id = str(in_progress[0].get("load_id")) if in_progress else None
+        if not target_load_id:
+            planned_rows = ctx.load_buckets["planned"]
+            if planned_rows:
+                target_load_id = str(planned_rows[0].get("load_id"))
+                self.assign_load(
+                    LoadAssignmentRequest(load_id=target_load_id, auto=True),
+                    tenant_id=tenant_id,
+                    actor="copilot",
                 )
-            dloads = self._loads_for_driver(loads, driver)
-            completed = [row for row in dloads if str(row.get("status", "")).lower() == LoadStatus.DELIVERED.value]
-            active = [row for row in dloads if str(row.get("status", "")).lower() != LoadStatus.DELIVERED.value]
-            completed_miles = round(sum(float(row.get("planned_miles") or 0.0) for row in completed), 1)
-            total_miles = round(sum(float(row.get("planned_miles") or 0.0) for row in dloads), 1)
-            head = ", ".join(str(row.get("load_id") or "") for row in completed[:5]) or "none"
-            answer = (
-                f"{driver.get('name')} has {len(dloads)} load(s): {len(completed)} complete, {len(active)} active. "
-                f"Completed miles: {completed_miles}. Total assigned miles: {total_miles}. "
-                f"Completed loads: {head}."
+                ctx = self._build_context(tenant_id)
+                load_lookup = ctx.load_lookup
+        if not target_load_id:
+            return self._reply(
+                started,
+                "No assigned loads are waiting for ticket review right now.",
+                confidence=0.92,
+                source="dispatch_board",
             )
-            return CopilotQueryResponse(
-                answer=answer,
-                sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
-                confidence=0.94,
-                processing_time_ms=elapsed,
+        target_load_id = self._resolve_load_id_from_lookup(target_load_id, load_lookup) or target_load_id
+        if target_load_id not in load_lookup:
+            return self._reply(
+                started,
+                f"{target_load_id} is not in the current dispatch board.",
+                confidence=0.9,
+                source="dispatch_board",
+            )
+        target = load_lookup[target_load_id]
+        reviewed = self._review_ticket_core(
+            TicketReviewRequest(
+                load_id=target_load_id,
+                ticket_number=f"TKT-AUTO-{int(time.time())}",
+                rated_miles=float(target.get("planned_miles") or 0.0),
+                gps_miles=round(float(target.get("planned_miles") or 0.0) * 1.01, 2),
+                zone=target.get("zone"),
+                expected_rate=float(target.get("rate_total") or 0.0),
+            ),
+            tenant_id=tenant_id,
+            actor="copilot",
+        )
+        if reviewed.status == TicketStatus.EXCEPTION:
+            return self._reply(
+                started,
+                (
+                    f"Reviewed {target_load_id}: flagged {reviewed.ticket_number}. "
+                    f"Reason: {reviewed.approval_reason}."
+                ),
+                confidence=max(float(reviewed.final_confidence), 0.88),
+                source=reviewed.review_id,
+                document_type="ticket_review",
             )
+        return self._reply(
+            started,
+            (
+                f"Reviewed {target_load_id}: approved {reviewed.ticket_number}. "
+                "Load moved to complete and driver released."
+            ),
+            confidence=max(float(reviewed.final_confidence), 0.9),
+            source=reviewed.review_id,
+            document_type="ticket_review",
+        )
 
-        ticket_ref = self._extract_ticket_reference(query or "")
-        if ticket_ref:
-            matched = None
-            for review in ops_state_store.list_reviews(tenant_id):
-                candidate = self._normalize_token(review.get("ticket_number"))
-                if candidate and (candidate == ticket_ref or ticket_ref in candidate):
-                    matched = review
-                    break
-
-            elapsed = (time.time() - started) * 1000
-            if not matched:
-                return CopilotQueryResponse(
-                    answer=(
-                        f"I could not find ticket {ticket_ref} in current reviews. "
-                        "Run ticket review first or verify the ticket number."
-                    ),
-                    sources=[{"filename": "ticket_queue", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.8,
-                    processing_time_ms=elapsed,
-                )
+    def _answer_driver_activity(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        query = turn.query
+        drivers = ctx.drivers
+        loads = ctx.loads
+        driver = self._match_driver_from_query(query, drivers)
+        if not driver:
+            known = ", ".join(str(d.get("name") or "") for d in drivers[:6]) or "no drivers configured"
+            return self._reply(
+                started,
+                f"I couldn't map that to a driver. Try one of: {known}.",
+                confidence=0.86,
+            )
+        dloads = self._loads_for_driver(loads, driver)
+        completed: list[Dict[str, Any]] = []
+        completed_miles = 0.0
+        total_miles = 0.0
+        for row in dloads:
+            miles = float(row.get("planned_miles") or 0.0)
+            total_miles += miles
+            if row.get("status") == LoadStatus.DELIVERED.value:
+                completed.append(row)
+                completed_miles += miles
+        head = ", ".join(str(row.get("load_id") or "") for row in completed[:5]) or "none"
+        answer = (
+            f"{driver.get('name')} has {len(dloads)} load(s): {len(completed)} complete, "
+            f"{len(dloads) - len(completed)} active. "
+            f"Completed miles: {round(completed_miles, 1)}. Total assigned miles: {round(total_miles, 1)}. "
+            f"Completed loads: {head}."
+        )
+        return self._reply(
+            started,
+            answer,
+            confidence=0.94,
+        )
 
-            failed = matched.get("failed_rules") or self._failed_rule_descriptions(
-                [RuleResult(**row) for row in (matched.get("rules") or [])]
-            )
-            missing = matched.get("missing_documents") or []
-            status = str(matched.get("status") or "unknown")
-            reason = matched.get("approval_reason") or "No reason captured"
-            load_id = matched.get("load_id") or "unknown load"
-            ticket_number = matched.get("ticket_number") or ticket_ref
-
-            parts = [f"Ticket {ticket_number} for {load_id} is {status}."]
-            if status == TicketStatus.EXCEPTION.value:
-                parts.append(f"Flag reason: {reason}.")
-                if failed and "Failed checks:" not in str(reason):
-                    parts.append(f"Failed checks: {'; '.join(failed[:3])}.")
-                if missing and "Missing docs:" not in str(reason):
-                    parts.append(f"Missing docs: {', '.join(missing)}.")
-                parts.append("Resolve by correcting those checks and re-running ticket review.")
-            else:
-                parts.append(f"Approval reason: {reason}.")
+    def _answer_ticket_reference(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        tenant_id = ctx.tenant_id
+        ticket_ref = turn.ticket_ref
+        matched = ops_state_store.find_review_by_ticket(tenant_id, ticket_ref)
 
-            return CopilotQueryResponse(
-                answer=" ".join(parts),
-                sources=[
-                    {
-                        "filename": matched.get("review_id", "ticket_review"),
-                        "document_type": "ticket_review",
-                        "similarity": 1.0,
-                    }
-                ],
-                confidence=max(float(matched.get("final_confidence") or 0.9), 0.88),
-                processing_time_ms=elapsed,
-            )
-
-        if (
-            any(
-                token in q
-                for token in ["flagged", "flag", "exception", "exceptions", "denied", "rejected", "failed", "did not pass", "didn't pass", "not pass"]
-            )
-            and any(token in q for token in ["ticket", "tickets", "queue", "tkt", "tk"])
-        ):
-            raw_flagged = [
-                row for row in ops_state_store.list_reviews(tenant_id)
-                if str(row.get("status", "")).lower() == TicketStatus.EXCEPTION.value
-            ]
-            flagged: list[dict] = []
-            seen_tickets: set[str] = set()
-            for row in raw_flagged:
-                key = str(row.get("ticket_number") or row.get("review_id") or "")
-                if key in seen_tickets:
-                    continue
-                seen_tickets.add(key)
-                flagged.append(row)
-                if len(flagged) >= 5:
-                    break
-            elapsed = (time.time() - started) * 1000
-            if not flagged:
-                return CopilotQueryResponse(
-                    answer="No tickets are currently flagged. Exception queue is clear.",
-                    sources=[{"filename": "ticket_queue", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.95,
-                    processing_time_ms=elapsed,
-                )
-            lines = []
-            for row in flagged:
-                ticket_number = row.get("ticket_number") or "unknown-ticket"
-                load_id = row.get("load_id") or "unknown-load"
-                reason = row.get("approval_reason") or "unspecified reason"
-                lines.append(f"{ticket_number} ({load_id}): {reason}")
-            return CopilotQueryResponse(
-                answer=f"{len(flagged)} flagged ticket(s): " + " | ".join(lines),
-                sources=[{"filename": "ticket_queue", "document_type": "ticket_review", "similarity": 1.0}],
-                confidence=0.94,
-                processing_time_ms=elapsed,
+        if not matched:
+            return self._reply(
+                started,
+                (
+                    f"I could not find ticket {ticket_ref} in current reviews. "
+                    "Run ticket review first or verify the ticket number."
+                ),
+                confidence=0.8,
+                source="ticket_queue",
             )
 
-        load_ticket_status_intent = (
-            bool(resolved_load_id)
-            and any(token in q for token in ["ticket", "tkt", "tk"])
-            and any(token in q for token in ["pass", "passed", "approved", "rejected", "status"])
+        failed = matched.get("failed_rules") or self._failed_rule_descriptions(
+            [RuleResult(**row) for row in (matched.get("rules") or [])]
         )
-        if load_ticket_status_intent:
-            elapsed = (time.time() - started) * 1000
-            review_rows = [
-                row
-                for row in ops_state_store.list_reviews(tenant_id)
-                if str(row.get("load_id") or "").upper() == str(resolved_load_id).upper()
-            ]
-            if not review_rows:
-                return CopilotQueryResponse(
-                    answer=f"{resolved_load_id} has no reviewed ticket yet.",
-                    sources=[{"filename": "ticket_queue", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.9,
-                    processing_time_ms=elapsed,
-                )
-            latest = review_rows[0]
-            ticket_number = latest.get("ticket_number") or "unknown-ticket"
-            status = str(latest.get("status") or "unknown")
-            reason = latest.get("approval_reason") or "no reason captured"
+        missing = matched.get("missing_documents") or []
+        status = str(matched.get("status") or "unknown")
+        reason = matched.get("approval_reason") or "No reason captured"
+        load_id = matched.get("load_id") or "unknown load"
+        ticket_number = matched.get("ticket_number") or ticket_ref
+
+        parts = [f"Ticket {ticket_number} for {load_id} is {status}."]
+        if status == TicketStatus.EXCEPTION.value:
+            parts.append(f"Flag reason: {reason}.")
+            if failed and "Failed checks:" not in str(reason):
+                parts.append(f"Failed checks: {'; '.join(failed[:3])}.")
+            if missing and "Missing docs:" not in str(reason):
+                parts.append(f"Missing docs: {', '.join(missing)}.")
+            parts.append("Resolve by correcting those checks and re-running ticket review.")
+        else:
+            parts.append(f"Approval reason: {reason}.")
+
+        return self._reply(
+            started,
+            " ".join(parts),
+            confidence=self._review_confidence(matched),
+            source=matched.get("review_id", "ticket_review"),
+            document_type="ticket_review",
+        )
+
+    def _answer_flagged_tickets(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        started = turn.started
+        flagged = ops_state_store.latest_reviews_by_ticket(turn.ctx.tenant_id, TicketStatus.EXCEPTION.value, limit=5)
+        if not flagged:
+            return self._reply(
+                started,
+                "No tickets are currently flagged. Exception queue is clear.",
+                confidence=0.95,
+                source="ticket_queue",
+            )
+        lines = " | ".join(
+            f"{row.get('ticket_number') or 'unknown-ticket'} ({row.get('load_id') or 'unknown-load'}): "
+            f"{row.get('approval_reason') or 'unspecified reason'}"
+            for row in flagged
+        )
+        return self._reply(
+            started,
+            f"{len(flagged)} flagged ticket(s): {lines}",
+            confidence=0.94,
+            source="ticket_queue",
+            document_type="ticket_review",
+        )
+
+    def _answer_load_ticket_status(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        tenant_id = ctx.tenant_id
+        resolved_load_id = turn.resolved_load_id
+        review_rows = ops_state_store.reviews_for_load(tenant_id, str(resolved_load_id))
+        if not review_rows:
+            return self._reply(
+                started,
+                f"{resolved_load_id} has no reviewed ticket yet.",
+                confidence=0.9,
+                source="ticket_queue",
+            )
+        latest = review_rows[0]
+        ticket_number = latest.get("ticket_number") or "unknown-ticket"
+        status = str(latest.get("status") or "unknown")
+        reason = latest.get("approval_reason") or "no reason captured"
+        answer = (
+            f"Latest ticket for {resolved_load_id} is {status}: {ticket_number}. "
+            f"Reason: {reason}."
+        )
+        return self._reply(
+            started,
+            answer,
+            confidence=self._review_confidence(latest),
+            source=latest.get("review_id", "ticket_review"),
+            document_type="ticket_review",
+        )
+
+    def _answer_load_ticket_issue(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        tenant_id = ctx.tenant_id
+        resolved_load_id = turn.resolved_load_id
+        review_rows = ops_state_store.reviews_for_load(tenant_id, str(resolved_load_id))
+        if not review_rows:
+            return self._reply(
+                started,
+                f"{resolved_load_id} has no reviewed ticket yet.",
+                confidence=0.9,
+                source="ticket_queue",
+            )
+        latest = review_rows[0]
+        status = latest.get("status") or "unknown"
+        reason = latest.get("approval_reason") or "no reason captured"
+        ticket_number = latest.get("ticket_number") or "unknown-ticket"
+        if status in {TicketStatus.EXCEPTION.value}:
             answer = (
-                f"Latest ticket for {resolved_load_id} is {status}: {ticket_number}. "
+                f"{resolved_load_id} ticket {ticket_number} is flagged. "
                 f"Reason: {reason}."
             )
-            return CopilotQueryResponse(
-                answer=answer,
-                sources=[{"filename": latest.get("review_id", "ticket_review"), "document_type": "ticket_review", "similarity": 1.0}],
-                confidence=max(float(latest.get("final_confidence") or 0.9), 0.88),
-                processing_time_ms=elapsed,
+        else:
+            answer = (
+                f"{resolved_load_id} ticket {ticket_number} is {status}; no blocking issue is open. "
+                f"Latest note: {reason}."
             )
-
-        load_ticket_issue_intent = (
-            bool(resolved_load_id)
-            and any(token in q for token in ["ticket", "tkt", "tk"])
-            and any(token in q for token in ["wrong", "issue", "problem", "deny", "denied", "flag", "failed"])
+        return self._reply(
+            started,
+            answer,
+            confidence=self._review_confidence(latest),
+            source=latest.get("review_id", "ticket_review"),
+            document_type="ticket_review",
         )
-        if load_ticket_issue_intent:
-            elapsed = (time.time() - started) * 1000
-            review_rows = [
-                row
-                for row in ops_state_store.list_reviews(tenant_id)
-                if str(row.get("load_id") or "").upper() == str(resolved_load_id).upper()
-            ]
-            if not review_rows:
-                return CopilotQueryResponse(
-                    answer=f"{resolved_load_id} has no reviewed ticket yet.",
-                    sources=[{"filename": "ticket_queue", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.9,
-                    processing_time_ms=elapsed,
-                )
-            latest = review_rows[0]
-            status = str(latest.get("status") or "unknown").lower()
-            reason = latest.get("approval_reason") or "no reason captured"
-            ticket_number = latest.get("ticket_number") or "unknown-ticket"
-            if status in {TicketStatus.EXCEPTION.value}:
-                answer = (
-                    f"{resolved_load_id} ticket {ticket_number} is flagged. "
-                    f"Reason: {reason}."
-                )
-            else:
-                answer = (
-                    f"{resolved_load_id} ticket {ticket_number} is {status}; no blocking issue is open. "
-                    f"Latest note: {reason}."
-                )
-            return CopilotQueryResponse(
-                answer=answer,
-                sources=[{"filename": latest.get("review_id", "ticket_review"), "document_type": "ticket_review", "similarity": 1.0}],
-                confidence=max(float(latest.get("final_confidence") or 0.9), 0.88),
-                processing_time_ms=elapsed,
-            )
 
-        load_route_intent = (
-            bool(resolved_load_id)
-            and "load" in q
-            and any(token in q for token in ["route", "pickup", "dropoff", "location", "drop off", "pick up"])
+    def _answer_load_route(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        resolved_load_id = turn.resolved_load_id
+        load_lookup = ctx.load_lookup
+        if resolved_load_id not in load_lookup:
+            return self._reply(
+                started,
+                f"{resolved_load_id} is not in the current dispatch board.",
+                confidence=0.9,
+                source="dispatch_board",
+            )
+        row = load_lookup[resolved_load_id]
+        assignment = row.get("assignment") or {}
+        driver = assignment.get("driver_name") or assignment.get("driver_id") or "unassigned"
+        answer = (
+            f"{resolved_load_id} route: pickup {row.get('pickup_location') or '-'} -> "
+            f"dropoff {row.get('delivery_location') or '-'}. "
+            f"Driver: {driver}. Status: {row.get('status')}. Miles: {row.get('planned_miles')}."
         )
-        if load_route_intent:
-            elapsed = (time.time() - started) * 1000
-            if resolved_load_id not in load_lookup:
-                return CopilotQueryResponse(
-                    answer=f"{resolved_load_id} is not in the current dispatch board.",
-                    sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.9,
-                    processing_time_ms=elapsed,
-                )
-            row = load_lookup[resolved_load_id]
-            assignment = row.get("assignment") or {}
-            driver = assignment.get("driver_name") or assignment.get("driver_id") or "unassigned"
-            answer = (
-                f"{resolved_load_id} route: pickup {row.get('pickup_location') or '-'} -> "
-                f"dropoff {row.get('delivery_location') or '-'}. "
-                f"Driver: {driver}. Status: {row.get('status')}. Miles: {row.get('planned_miles')}."
+        return self._reply(
+            started,
+            answer,
+            confidence=0.95,
+            source="dispatch_board",
+        )
+
+    def _answer_load_miles(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        tenant_id = ctx.tenant_id
+        resolved_load_id = turn.resolved_load_id
+        load_lookup = ctx.load_lookup
+        if resolved_load_id not in load_lookup:
+            return self._reply(
+                started,
+                f"{resolved_load_id} is not in the current dispatch board.",
+                confidence=0.9,
+                source="dispatch_board",
             )
-            return CopilotQueryResponse(
-                answer=answer,
-                sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                confidence=0.95,
-                processing_time_ms=elapsed,
-            )
-
-        load_miles_intent = bool(resolved_load_id) and "load" in q and any(token in q for token in ["mile", "miles"])
-        if load_miles_intent:
-            elapsed = (time.time() - started) * 1000
-            if resolved_load_id not in load_lookup:
-                return CopilotQueryResponse(
-                    answer=f"{resolved_load_id} is not in the current dispatch board.",
-                    sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.9,
-                    processing_time_ms=elapsed,
-                )
-            row = load_lookup[resolved_load_id]
-            planned_miles = float(row.get("planned_miles") or 0.0)
-            gps_miles = ops_state_store.latest_samsara_miles(tenant_id, resolved_load_id, hours_back=168)
-            if gps_miles is None:
-                answer = f"{resolved_load_id} has {planned_miles:.1f} planned miles. No GPS miles synced yet."
-            else:
-                variance = abs(gps_miles - planned_miles)
-                answer = (
-                    f"{resolved_load_id} has {planned_miles:.1f} planned miles and {gps_miles:.1f} GPS miles "
-                    f"(variance {variance:.1f})."
-                )
-            return CopilotQueryResponse(
-                answer=answer,
-                sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                confidence=0.95,
-                processing_time_ms=elapsed,
+        row = load_lookup[resolved_load_id]
+        planned_miles = float(row.get("planned_miles") or 0.0)
+        gps_miles = ops_state_store.latest_samsara_miles(tenant_id, resolved_load_id, hours_back=168)
+        if gps_miles is None:
+            answer = f"{resolved_load_id} has {planned_miles:.1f} planned miles. No GPS miles synced yet."
+        else:
+            variance = abs(gps_miles - planned_miles)
+            answer = (
+                f"{resolved_load_id} has {planned_miles:.1f} planned miles and {gps_miles:.1f} GPS miles "
+                f"(variance {variance:.1f})."
             )
-
-        driver_stop_intent = (
-            any(token in q for token in ["stop", "stops"])
-            and ("driver" in q or any(str(driver.get("name", "")).split(" ")[0].lower() in q for driver in drivers))
+        return self._reply(
+            started,
+            answer,
+            confidence=0.95,
+            source="dispatch_board",
         )
-        if driver_stop_intent:
-            elapsed = (time.time() - started) * 1000
-            driver = self._match_driver_from_query(query, drivers)
-            if not driver:
-                known = ", ".join(str(d.get("name") or "") for d in drivers[:6]) or "no drivers configured"
-                return CopilotQueryResponse(
-                    answer=f"I couldn't map that to a driver. Try one of: {known}.",
-                    sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.84,
-                    processing_time_ms=elapsed,
-                )
 
-            dloads = self._loads_for_driver(loads, driver)
-            load_ids = [str(row.get("load_id") or "") for row in dloads if row.get("load_id")]
-            events = ops_state_store.query_samsara_events(tenant_id, load_ids, hours_back=168) if load_ids else []
-            total_stops = int(sum(int(row.get("stop_events") or 0) for row in events))
-            stops_by_load: Dict[str, int] = {}
-            for row in events:
-                lid = str(row.get("load_id") or "")
-                stops_by_load[lid] = stops_by_load.get(lid, 0) + int(row.get("stop_events") or 0)
+    def _answer_driver_stops(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        tenant_id = ctx.tenant_id
+        query = turn.query
+        drivers = ctx.drivers
+        loads = ctx.loads
+        driver = self._match_driver_from_query(query, drivers)
+        if not driver:
+            known = ", ".join(str(d.get("name") or "") for d in drivers[:6]) or "no drivers configured"
+            return self._reply(
+                started,
+                f"I couldn't map that to a driver. Try one of: {known}.",
+                confidence=0.84,
+            )
 
-            if total_stops <= 0:
-                answer = (
-                    f"No stop telemetry is available yet for {driver.get('name')}. "
-                    f"Assigned loads in scope: {', '.join(load_ids[:5]) or 'none'}."
-                )
-                confidence = 0.82
-            else:
-                top = ", ".join(f"{lid}:{count}" for lid, count in list(stops_by_load.items())[:5])
-                answer = (
-                    f"{driver.get('name')} logged {total_stops} stop event(s) in the last 7 days "
-                    f"across {len(load_ids)} load(s). Stops by load: {top}."
-                )
-                confidence = 0.93
-            return CopilotQueryResponse(
-                answer=answer,
-                sources=[{"filename": "samsara_events", "document_type": "system_state", "similarity": 1.0}],
-                confidence=confidence,
-                processing_time_ms=elapsed,
+        dloads = self._loads_for_driver(loads, driver)
+        load_ids = [str(row.get("load_id") or "") for row in dloads if row.get("load_id")]
+        stops_by_load = ops_state_store.samsara_stops_by_load(tenant_id, load_ids, hours_back=168)
+        total_stops = sum(stops_by_load.values())
+
+        if total_stops <= 0:
+            answer = (
+                f"No stop telemetry is available yet for {driver.get('name')}. "
+                f"Assigned loads in scope: {', '.join(load_ids[:5]) or 'none'}."
+            )
+            confidence = 0.82
+        else:
+            top = ", ".join(f"{lid}:{count}" for lid, count in list(stops_by_load.items())[:5])
+            answer = (
+                f"{driver.get('name')} logged {total_stops} stop event(s) in the last 7 days "
+                f"across {len(load_ids)} load(s). Stops by load: {top}."
             )
+            confidence = 0.93
+        return self._reply(
+            started,
+            answer,
+            confidence=confidence,
+            source="samsara_events",
+        )
 
-        load_ownership_intent = (
-            bool(resolved_load_id)
-            and "load" in q
-            and any(
-                token in q
-                for token in ["who did", "who has", "who took", "assigned to", "who is on", "who owns", "what driver did"]
+    def _answer_load_ownership(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        resolved_load_id = turn.resolved_load_id
+        load_lookup = ctx.load_lookup
+        if resolved_load_id not in load_lookup:
+            return self._reply(
+                started,
+                (
+                    f"{resolved_load_id} is not in the current dispatch board. "
+                    "Refresh board data or verify the load ID."
+                ),
+                confidence=0.92,
+                source="dispatch_board",
             )
+        row = load_lookup[resolved_load_id]
+        assignment = row.get("assignment") or {}
+        driver = assignment.get("driver_name") or assignment.get("driver_id") or "unassigned"
+        return self._reply(
+            started,
+            f"{resolved_load_id} is assigned to {driver}. Current status: {row.get('status')}.",
+            confidence=0.95,
         )
-        if load_ownership_intent:
-            elapsed = (time.time() - started) * 1000
-            if resolved_load_id not in load_lookup:
-                return CopilotQueryResponse(
-                    answer=(
-                        f"{resolved_load_id} is not in the current dispatch board. "
-                        "Refresh board data or verify the load ID."
-                    ),
-                    sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.92,
-                    processing_time_ms=elapsed,
-                )
-            row = load_lookup[resolved_load_id]
-            assignment = row.get("assignment") or {}
-            driver = assignment.get("driver_name") or assignment.get("driver_id") or "unassigned"
-            return CopilotQueryResponse(
-                answer=f"{resolved_load_id} is assigned to {driver}. Current status: {row.get('status')}.",
-                sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
-                confidence=0.95,
-                processing_time_ms=elapsed,
-            )
-
-        direct_load_action_intent = bool(resolved_load_id) and re.match(r"^\s*(do|assign|schedule|take|run)\b", q)
-        if direct_load_action_intent:
-            elapsed = (time.time() - started) * 1000
-            if resolved_load_id not in load_lookup:
-                return CopilotQueryResponse(
-                    answer=f"{resolved_load_id} is not in the current dispatch board.",
-                    sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.9,
-                    processing_time_ms=elapsed,
-                )
-            target = load_lookup[resolved_load_id]
-            if str(target.get("status", "")).lower() != LoadStatus.PLANNED.value:
-                assn = target.get("assignment") or {}
-                driver = assn.get("driver_name") or assn.get("driver_id") or "unassigned"
-                return CopilotQueryResponse(
-                    answer=(
-                        f"{resolved_load_id} is already {target.get('status')} and assigned to {driver}. "
-                        "No reassignment needed."
-                    ),
-                    sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.93,
-                    processing_time_ms=elapsed,
-                )
-            available = [d for d in drivers if str(d.get("status", "")).lower() == "available"]
-            if not available:
-                return CopilotQueryResponse(
-                    answer=f"{resolved_load_id} is planned, but no drivers are currently available.",
-                    sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.92,
-                    processing_time_ms=elapsed,
-                )
-            assignment = self.assign_load(
-                LoadAssignmentRequest(load_id=resolved_load_id, auto=True),
-                tenant_id=tenant_id,
-                actor="copilot",
+
+    def _answer_direct_load_action(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        tenant_id = ctx.tenant_id
+        resolved_load_id = turn.resolved_load_id
+        load_lookup = ctx.load_lookup
+        if resolved_load_id not in load_lookup:
+            return self._reply(
+                started,
+                f"{resolved_load_id} is not in the current dispatch board.",
+                confidence=0.9,
+                source="dispatch_board",
             )
-            return CopilotQueryResponse(
-                answer=(
-                    f"Assigned {resolved_load_id} to {assignment.get('driver_name')} "
-                    f"({assignment.get('truck_id')})."
+        target = load_lookup[resolved_load_id]
+        if target.get("status") != LoadStatus.PLANNED.value:
+            assn = target.get("assignment") or {}
+            driver = assn.get("driver_name") or assn.get("driver_id") or "unassigned"
+            return self._reply(
+                started,
+                (
+                    f"{resolved_load_id} is already {target.get('status')} and assigned to {driver}. "
+                    "No reassignment needed."
                 ),
-                sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                confidence=0.94,
-                processing_time_ms=(time.time() - started) * 1000,
+                confidence=0.93,
+                source="dispatch_board",
             )
+        available = ctx.driver_buckets["available"]
+        if not available:
+            return self._reply(
+                started,
+                f"{resolved_load_id} is planned, but no drivers are currently available.",
+                confidence=0.92,
+                source="dispatch_board",
+            )
+        assignment = self.assign_load(
+            LoadAssignmentRequest(load_id=resolved_load_id, auto=True),
+            tenant_id=tenant_id,
+            actor="copilot",
+        )
+        return self._reply(
+            started,
+            (
+                f"Assigned {resolved_load_id} to {assignment.get('driver_name')} "
+                f"({assignment.get('truck_id')})."
+            ),
+            confidence=0.94,
+            source="dispatch_board",
+        )
 
-        auto_assign_intent = (
-            any(token in q for token in ["auto assign", "assign new loads", "schedule loads", "schedule load"])
-            or ("assign" in q and "load" in q)
-            or ("schedule" in q and "load" in q)
-            or ("drivers are taken" in q and "assign" in q)
+    def _answer_auto_assign(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        tenant_id = ctx.tenant_id
+        intents = turn.intents
+        pre_available = ctx.driver_buckets["available"]
+        assign_limit = 20
+        if "assign_all" in intents:
+            assign_limit = max(1, len(pre_available))
+        recycled = 0
+        if "drivers_done" in intents:
+            recycled = self._release_drivers_from_completed_reviews(tenant_id, actor="copilot")
+        prefinalized = self._finalize_approved_assigned_loads(tenant_id, actor="copilot")
+        assigned_count, errors, assignments = self._auto_assign_planned_loads(tenant_id, actor="copilot", limit=assign_limit)
+        quick_reviews: list[Dict[str, Any]] = []
+        for row in assignments:
+            reviewed = self._run_quick_ticket_review(tenant_id, row.get("load_id", ""), actor="copilot")
+            if reviewed:
+                quick_reviews.append(reviewed)
+        # The writes above invalidate the memoized board; the summary only needs counts.
+        counts = ops_state_store.status_counts(tenant_id)
+        load_counts = counts["loads"]
+        completed = load_counts[LoadStatus.DELIVERED.value]
+        summary = (
+            f"Summary -> active: {sum(load_counts.values()) - completed}, "
+            f"assigned: {sum(load_counts[status] for status in _IN_PROGRESS_STATUSES)}, "
+            f"complete: {completed}, planned: {load_counts[LoadStatus.PLANNED.value]}, "
+            f"available drivers: {counts['drivers']['available']}."
         )
-        if auto_assign_intent:
-            pre_available = [d for d in drivers if str(d.get("status", "")).lower() == "available"]
-            assign_limit = 20
-            if any(token in q for token in ["assign them", "assign those", "available drivers", "assign all available"]):
-                assign_limit = max(1, len(pre_available))
-            recycled = 0
-            if any(token in q for token in ["finished", "done", "completed", "all my drivers are taken", "drivers are taken"]):
-                recycled = self._release_drivers_from_completed_reviews(tenant_id, actor="copilot")
-            prefinalized = self._finalize_approved_assigned_loads(tenant_id, actor="copilot")
-            assigned_count, errors, assignments = self._auto_assign_planned_loads(tenant_id, actor="copilot", limit=assign_limit)
-            quick_reviews: list[Dict[str, Any]] = []
-            for row in assignments:
-                reviewed = self._run_quick_ticket_review(tenant_id, row.get("load_id", ""), actor="copilot")
-                if reviewed:
-                    quick_reviews.append(reviewed)
-            board = self.dispatch_board(tenant_id)
-            board_loads = self._safe_rows(board.get("loads"))
-            available = [d for d in board.get("drivers", []) if str(d.get("status", "")).lower() == "available"]
-            planned = [l for l in board_loads if str(l.get("status", "")).lower() == LoadStatus.PLANNED.value]
-            active = [l for l in board_loads if str(l.get("status", "")).lower() != LoadStatus.DELIVERED.value]
-            assigned_open = [
-                l for l in board_loads
-                if str(l.get("status", "")).lower() in {LoadStatus.ASSIGNED.value, LoadStatus.EN_ROUTE.value}
-            ]
-            completed = [l for l in board_loads if str(l.get("status", "")).lower() == LoadStatus.DELIVERED.value]
-            elapsed = (time.time() - started) * 1000
-            if assigned_count > 0:
-                assignment_text = ", ".join(
-                    f"{row.get('load_id')} -> {row.get('driver_name')} ({row.get('truck_id') or '-'})"
-                    for row in assignments
-                )
-                review_text = ", ".join(
-                    f"{row.get('load_id')}/{row.get('ticket_number')}={row.get('status')}"
-                    for row in quick_reviews
-                )
-                return CopilotQueryResponse(
-                    answer=(
-                        f"I assigned {assigned_count} new load(s). "
-                        f"Assignments: {assignment_text or 'none'}. "
-                        f"Ticket checks: {review_text or 'none'}. "
-                        f"Finalized from passed tickets: {len(prefinalized)}. Released {recycled} completed driver(s). "
-                        f"Summary -> active: {len(active)}, assigned: {len(assigned_open)}, complete: {len(completed)}, planned: {len(planned)}, available drivers: {len(available)}."
-                    ),
-                    sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.93,
-                    processing_time_ms=elapsed,
-                )
-            if errors:
-                return CopilotQueryResponse(
-                    answer=(
-                        f"No new assignments were made. Finalized from passed tickets: {len(prefinalized)}. "
-                        f"Released {recycled} driver(s). First blocker: {errors[0]}. "
-                        f"Summary -> active: {len(active)}, assigned: {len(assigned_open)}, complete: {len(completed)}, planned: {len(planned)}, available drivers: {len(available)}."
-                    ),
-                    sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.9,
-                    processing_time_ms=elapsed,
-                )
-            return CopilotQueryResponse(
-                answer=(
-                    f"No new assignments were made. Finalized from passed tickets: {len(prefinalized)}. "
-                    f"Released {recycled} driver(s). "
-                    f"Summary -> active: {len(active)}, assigned: {len(assigned_open)}, complete: {len(completed)}, planned: {len(planned)}, available drivers: {len(available)}."
+        if assigned_count > 0:
+            assignment_text = ", ".join(
+                f"{row.get('load_id')} -> {row.get('driver_name')} ({row.get('truck_id') or '-'})"
+                for row in assignments
+            )
+            review_text = ", ".join(
+                f"{row.get('load_id')}/{row.get('ticket_number')}={row.get('status')}"
+                for row in quick_reviews
+            )
+            return self._reply(
+                started,
+                (
+                    f"I assigned {assigned_count} new load(s). "
+                    f"Assignments: {assignment_text or 'none'}. "
+                    f"Ticket checks: {review_text or 'none'}. "
+                    f"Finalized from passed tickets: {len(prefinalized)}. Released {recycled} completed driver(s). {summary}"
                 ),
-                sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                confidence=0.9,
-                processing_time_ms=elapsed,
-            )
-
-        if "schedule" in q and "load" in q:
-            available = [d for d in drivers if str(d.get("status", "")).lower() == "available"]
-            planned = [l for l in loads if str(l.get("status", "")).lower() == LoadStatus.PLANNED.value]
-            elapsed = (time.time() - started) * 1000
-            if resolved_load_id and resolved_load_id in load_lookup:
-                target = load_lookup[resolved_load_id]
-                if not available:
-                    return CopilotQueryResponse(
-                        answer=f"{resolved_load_id} is ready, but no drivers are currently available to schedule.",
-                        sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
-                        confidence=0.92,
-                        processing_time_ms=elapsed,
-                    )
-                pick = available[0]
-                return CopilotQueryResponse(
-                    answer=(
-                        f"Recommended schedule for {resolved_load_id}: assign {pick.get('name')} ({pick.get('truck_id')}) "
-                        f"for {target.get('pickup_location')} -> {target.get('delivery_location')}."
-                    ),
-                    sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.93,
-                    processing_time_ms=elapsed,
-                )
-            if not planned:
-                return CopilotQueryResponse(
-                    answer="No planned loads are waiting for scheduling right now.",
-                    sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.9,
-                    processing_time_ms=elapsed,
-                )
-            head = ", ".join(l.get("load_id", "") for l in planned[:3])
-            return CopilotQueryResponse(
-                answer=(
-                    f"{len(planned)} loads are in planned status. Next candidates: {head}. "
-                    f"Available drivers: {len(available)}."
+                confidence=0.93,
+                source="dispatch_board",
+            )
+        if errors:
+            return self._reply(
+                started,
+                (
+                    f"No new assignments were made. Finalized from passed tickets: {len(prefinalized)}. "
+                    f"Released {recycled} driver(s). First blocker: {errors[0]}. {summary}"
                 ),
-                sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
                 confidence=0.9,
-                processing_time_ms=elapsed,
-            )
-
-        if "driver" in q or "drivers" in q or "fleet" in q:
-            total = len(drivers)
-            available = [d for d in drivers if str(d.get("status", "")).lower() == "available"]
-            assigned = [d for d in drivers if str(d.get("status", "")).lower() == "assigned"]
-            ask_total_only = ("how many" in q and "available" not in q)
-            ask_list_all = any(
-                token in q
-                for token in ["who are my drivers", "list drivers", "my drivers", "who are the drivers", "driver roster"]
-            )
-            if ask_total_only:
-                answer = f"You have {total} drivers total: {len(available)} available and {len(assigned)} assigned."
-            elif ask_list_all:
-                all_names = ", ".join(
-                    f"{d.get('name')} ({d.get('truck_id', '-')}, {str(d.get('status', 'unknown')).lower()})"
-                    for d in drivers[:12]
-                ) or "No drivers configured."
-                answer = f"Driver roster ({total}): {all_names}"
-            elif available:
-                names = ", ".join(f"{d.get('name')} ({d.get('truck_id', '-')})" for d in available[:8])
+                source="dispatch_board",
+            )
+        return self._reply(
+            started,
+            (
+                f"No new assignments were made. Finalized from passed tickets: {len(prefinalized)}. "
+                f"Released {recycled} driver(s). {summary}"
+            ),
+            confidence=0.9,
+            source="dispatch_board",
+        )
+
+    def _answer_driver_overview(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        intents = turn.intents
+        drivers = ctx.drivers
+        total = len(drivers)
+        available = ctx.driver_buckets["available"]
+        assigned = ctx.driver_buckets["assigned"]
+        ask_total_only = "how_many" in intents and "available" not in intents
+        ask_list_all = "driver_roster" in intents
+        if ask_total_only:
+            answer = f"You have {total} drivers total: {len(available)} available and {len(assigned)} assigned."
+        elif ask_list_all:
+            all_names = ", ".join(
+                f"{d.get('name')} ({d.get('truck_id', '-')}, {str(d.get('status', 'unknown')).lower()})"
+                for d in drivers[:12]
+            ) or "No drivers configured."
+            answer = f"Driver roster ({total}): {all_names}"
+        elif available:
+            names = ", ".join(f"{d.get('name')} ({d.get('truck_id', '-')})" for d in available[:8])
+            answer = (
+                f"{len(available)} drivers are available right now: {names}."
+                f" {len(assigned)} currently assigned."
+            )
+        else:
+            all_names = ", ".join(f"{d.get('name')} ({str(d.get('status', 'unknown')).lower()})" for d in drivers[:8])
+            if all_names:
                 answer = (
-                    f"{len(available)} drivers are available right now: {names}."
-                    f" {len(assigned)} currently assigned."
+                    f"No drivers are marked available right now. "
+                    f"Current driver states: {all_names}."
                 )
             else:
-                all_names = ", ".join(f"{d.get('name')} ({str(d.get('status', 'unknown')).lower()})" for d in drivers[:8])
-                if all_names:
-                    answer = (
-                        f"No drivers are marked available right now. "
-                        f"Current driver states: {all_names}."
-                    )
-                else:
-                    answer = "No drivers are configured right now."
-            elapsed = (time.time() - started) * 1000
-            return CopilotQueryResponse(
-                answer=answer,
-                sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
-                confidence=0.96,
-                processing_time_ms=elapsed,
-            )
-
-        if any(token in q for token in ["how many loads", "active loads", "unassigned", "dispatch board"]):
-            active = [row for row in loads if row.get("status") != "delivered"]
-            unassigned = [row for row in active if not row.get("assignment")]
+                answer = "No drivers are configured right now."
+        return self._reply(
+            started,
+            answer,
+            confidence=0.96,
+        )
+
+    def _answer_board_summary(self, turn: _CopilotTurn) -> CopilotQueryResponse:
+        ctx = turn.ctx
+        started = turn.started
+        active = ctx.load_buckets["active"]
+        unassigned = [row for row in active if not row.get("assignment")]
+        answer = (
+            f"Dispatch has {len(active)} active loads, with {len(unassigned)} unassigned and "
+            f"{len(active) - len(unassigned)} already assigned."
+        )
+        return self._reply(
+            started,
+            answer,
+            confidence=0.95,
+        )
+
+    def _answer_load_status(self, turn: _CopilotTurn) -> CopilotQueryResponse | None:
+        ctx = turn.ctx
+        started = turn.started
+        intents = turn.intents
+        resolved_load_id = turn.resolved_load_id
+        load_lookup = ctx.load_lookup
+        if resolved_load_id and resolved_load_id in load_lookup and "load_status" in intents:
+            row = load_lookup[resolved_load_id]
+            assignment = row.get("assignment") or {}
+            driver = assignment.get("driver_name") or assignment.get("driver_id") or "unassigned"
             answer = (
-                f"Dispatch has {len(active)} active loads, with {len(unassigned)} unassigned and "
-                f"{len(active) - len(unassigned)} already assigned."
+                f"{resolved_load_id} is currently {row.get('status')} and assigned to {driver}. "
+                f"Route: {row.get('pickup_location')} -> {row.get('delivery_location')}."
             )
-            elapsed = (time.time() - started) * 1000
-            return CopilotQueryResponse(
-                answer=answer,
-                sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
-                confidence=0.95,
-                processing_time_ms=elapsed,
+            return self._reply(
+                started,
+                answer,
+                confidence=0.94,
+            )
+        if resolved_load_id and "load_status_owner" in intents:
+            return self._reply(
+                started,
+                (
+                    f"{resolved_load_id} is not in current live state. "
+                    "Try refreshing the board or use a recent load ID."
+                ),
+                confidence=0.9,
+                source="dispatch_board",
             )
 
-        if "load " in q:
-            if resolved_load_id and resolved_load_id in load_lookup and any(t in q for t in ["status", "assigned", "driver"]):
-                row = load_lookup[resolved_load_id]
-                assignment = row.get("assignment") or {}
-                driver = assignment.get("driver_name") or assignment.get("driver_id") or "unassigned"
-                answer = (
-                    f"{resolved_load_id} is currently {row.get('status')} and assigned to {driver}. "
-                    f"Route: {row.get('pickup_location')} -> {row.get('delivery_location')}."
-                )
-                elapsed = (time.time() - started) * 1000
-                return CopilotQueryResponse(
-                    answer=answer,
-                    sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.94,
-                    processing_time_ms=elapsed,
-                )
-            if resolved_load_id and any(t in q for t in ["status", "assigned", "driver", "who did", "who has"]):
-                elapsed = (time.time() - started) * 1000
-                return CopilotQueryResponse(
-                    answer=(
-                        f"{resolved_load_id} is not in current live state. "
-                        "Try refreshing the board or use a recent load ID."
-                    ),
-                    sources=[{"filename": "dispatch_board", "document_type": "system_state", "similarity": 1.0}],
-                    confidence=0.9,
-                    processing_time_ms=elapsed,
-                )
-
-        return None
+    # Intent routes in priority order: the first handler whose required signals are all present
+    # and whose forbidden signals are all absent answers the query. A handler may return None to
+    # let later routes try.
+    _OPS_STATE_ROUTES = (
+        (frozenset({"why", "complete", "load"}), frozenset(), _answer_why_not_complete),
+        (frozenset({"review_ticket"}), frozenset({"diagnose"}), _answer_review_ticket),
+        (frozenset({"driver_activity", "driver_named"}), frozenset(), _answer_driver_activity),
+        (frozenset({"ticket_ref"}), frozenset(), _answer_ticket_reference),
+        (frozenset({"flagged", "ticket_queue"}), frozenset(), _answer_flagged_tickets),
+        (frozenset({"load_id", "ticket", "ticket_verdict"}), frozenset(), _answer_load_ticket_status),
+        (frozenset({"load_id", "ticket", "ticket_issue"}), frozenset(), _answer_load_ticket_issue),
+        (frozenset({"load_id", "load", "route"}), frozenset(), _answer_load_route),
+        (frozenset({"load_id", "load", "miles"}), frozenset(), _answer_load_miles),
+        (frozenset({"stops", "driver"}), frozenset(), _answer_driver_stops),
+        (frozenset({"stops", "driver_named"}), frozenset(), _answer_driver_stops),
+        (frozenset({"load_id", "load", "ownership"}), frozenset(), _answer_load_ownership),
+        (frozenset({"load_id", "direct_action"}), frozenset(), _answer_direct_load_action),
+        (frozenset({"auto_assign"}), frozenset(), _answer_auto_assign),
+        (frozenset({"assign", "load"}), frozenset(), _answer_auto_assign),
+        (frozenset({"schedule", "load"}), frozenset(), _answer_auto_assign),
+        (frozenset({"drivers_taken", "assign"}), frozenset(), _answer_auto_assign),
+        (frozenset({"driver"}), frozenset(), _answer_driver_overview),
+        (frozenset({"fleet"}), frozenset(), _answer_driver_overview),
+        (frozenset({"board_summary"}), frozenset(), _answer_board_summary),
+        (frozenset({"load_word"}), frozenset(), _answer_load_status),
+    )
 
     def _try_document_fact_answer(
         self,
@@ -1968,65 +2453,77 @@ class OpsEngine:
         tenant_id: str,
         started: float,
         load_id_hint: Optional[str] = None,
+        prefetched_load: Optional[Dict[str, Any]] = None,
     ) -> CopilotQueryResponse | None:
-        q = self._normalize_query_for_intents(query)
-        wants_broker = "broker" in q
-        wants_invoice = "invoice" in q or "inv" in q
-        wants_rate = "rate" in q or "rpm" in q
-        wants_bol = "bol" in q or "bill of lading" in q or "pro " in q
-        if not any([wants_broker, wants_invoice, wants_rate, wants_bol]):
+        q, query_load_ids = self._scan_query(query or "")
+        intents = _query_intents(q)
+        wants_broker = "broker" in intents
+        wants_invoice = "invoice" in intents
+        wants_rate = "rate" in intents
+        wants_bol = "bol" in intents
+        if intents.isdisjoint(_DOC_FACT_INTENTS):
             return None
 
+        # query_load_ids is already the scanned, de-duplicated list; only an explicit hint needs normalizing.
         load_ids: list[str] = []
-        hint = self._extract_load_id(query, explicit=load_id_hint)
+        hint = self._normalize_load_id(load_id_hint) if load_id_hint and load_id_hint.strip() else None
         if hint:
             load_ids.append(hint)
-        for load_id in self._extract_load_ids(query):
+        for load_id in query_load_ids:
             if load_id not in load_ids:
                 load_ids.append(load_id)
         if not load_ids:
             return None
 
-        all_loads = ops_state_store.list_loads(tenant_id)
-        resolved_load_ids: list[str] = []
-        for load_id in load_ids[:3]:
+        load_ids = load_ids[:3]
+        exact: Dict[str, Dict[str, Any]] = {}
+        if prefetched_load and prefetched_load.get("load_id") in load_ids:
+            exact[prefetched_load["load_id"]] = prefetched_load
+        exact.update(ops_state_store.get_loads(tenant_id, [load_id for load_id in load_ids if load_id not in exact]))
+        # Normalized-id index over the board, built only if a hinted id misses an exact lookup.
+        by_token: Optional[Dict[str, Dict[str, Any]]] = None
+        resolved_loads: Dict[str, Dict[str, Any]] = {}
+        for load_id in load_ids:
             resolved = load_id
-            if not ops_state_store.get_load(tenant_id, resolved):
-                normalized = self._normalize_token(resolved)
-                for row in all_loads:
-                    candidate = str(row.get("load_id") or "")
-                    if candidate and self._normalize_token(candidate) == normalized:
-                        resolved = candidate
-                        break
-            if resolved not in resolved_load_ids:
-                resolved_load_ids.append(resolved)
+            row = exact.get(resolved)
+            if not row:
+                if by_token is None:
+                    by_token = {}
+                    for candidate in ops_state_store.list_loads(tenant_id):
+                        token = self._normalize_token(candidate.get("load_id"))
+                        if token:
+                            by_token.setdefault(token, candidate)
+                row = by_token.get(self._normalize_token(resolved))
+                if row:
+                    resolved = str(row.get("load_id"))
+            resolved_loads.setdefault(resolved, row or {})
 
+        docs_by_load = document_registry.find_related_bulk(list(resolved_loads), tenant_id=tenant_id)
         answer_segments: list[str] = []
         sources: list[Dict[str, Any]] = []
-        for load_id in resolved_load_ids:
-            docs = document_registry.find_related(load_id, tenant_id=tenant_id)
+        for load_id, load in resolved_loads.items():
+            docs = docs_by_load[load_id]
             if not docs:
                 continue
 
-            invoice = None
-            rate_conf = None
-            bol = None
+            # Newest document of each type wins; docs arrive sorted by updated_at descending.
+            by_type: Dict[str, Dict[str, Any]] = {}
             for doc in docs:
-                kind = str(doc.get("document_type") or "")
-                if kind == DocumentType.INVOICE.value and invoice is None:
-                    invoice = doc
-                elif kind == DocumentType.RATE_CONFIRMATION.value and rate_conf is None:
-                    rate_conf = doc
-                elif kind == DocumentType.BOL.value and bol is None:
-                    bol = doc
+                kind = doc.get("document_type")
+                if kind in _DOC_FACT_TYPES and kind not in by_type:
+                    by_type[kind] = doc
+                    if len(by_type) == len(_DOC_FACT_TYPES):
+                        break
+            invoice = by_type.get(_INVOICE_TYPE)
+            rate_conf = by_type.get(_RATE_CONF_TYPE)
+            bol = by_type.get(_BOL_TYPE)
 
             if invoice is None and rate_conf is None and bol is None:
                 continue
 
-            load = ops_state_store.get_load(tenant_id, load_id) or {}
             broker = (
-                ((rate_conf or {}).get("extracted_data") or {}).get("broker_name")
-                or ((invoice or {}).get("extracted_data") or {}).get("broker_name")
+                self._extracted_field(rate_conf, "broker_name")
+                or self._extracted_field(invoice, "broker_name")
                 or load.get("broker")
                 or "unknown broker"
             )
@@ -2035,28 +2532,28 @@ class OpsEngine:
             if wants_broker:
                 segment_parts.append(f"broker {broker}")
             if wants_invoice:
-                invoice_number = ((invoice or {}).get("extracted_data") or {}).get("invoice_number")
-                total = ((invoice or {}).get("extracted_data") or {}).get("total_amount")
+                invoice_number = self._extracted_field(invoice, "invoice_number")
+                total = self._extracted_field(invoice, "total_amount")
                 if invoice_number:
                     invoice_text = f"invoice {invoice_number}"
                     if total:
-                        invoice_text += f" (${float(total):,.2f})"
+                        invoice_text += f" ({_format_usd(float(total))})"
                     segment_parts.append(invoice_text)
                 else:
                     segment_parts.append("invoice not found")
             if wants_rate:
-                rate_value = ((rate_conf or {}).get("extracted_data") or {}).get("rate")
-                rpm = ((rate_conf or {}).get("extracted_data") or {}).get("rate_per_mile")
+                rate_value = self._extracted_field(rate_conf, "rate")
+                rpm = self._extracted_field(rate_conf, "rate_per_mile")
                 if rate_value is not None:
-                    rate_text = f"rate ${float(rate_value):,.2f}"
+                    rate_text = f"rate {_format_usd(float(rate_value))}"
                     if rpm is not None:
-                        rate_text += f" (${float(rpm):,.2f}/mi)"
+                        rate_text += f" ({_format_usd(float(rpm))}/mi)"
                     segment_parts.append(rate_text)
                 else:
                     segment_parts.append("rate not found")
             if wants_bol:
-                bol_number = ((bol or {}).get("extracted_data") or {}).get("bol_number")
-                pro_number = ((bol or {}).get("extracted_data") or {}).get("pro_number")
+                bol_number = self._extracted_field(bol, "bol_number")
+                pro_number = self._extracted_field(bol, "pro_number")
                 bol_text = "BOL/pro not found"
                 if bol_number or pro_number:
                     parts = []
@@ -2069,26 +2566,26 @@ class OpsEngine:
 
             if not segment_parts:
                 continue
-            answer_segments.append(f"{load_id}: " + ", ".join(segment_parts))
-            for doc in (rate_conf, invoice, bol):
-                if not doc:
-                    continue
-                sources.append(
-                    {
-                        "filename": doc.get("filename"),
-                        "document_type": doc.get("document_type"),
-                        "similarity": 0.99,
-                        "document_id": doc.get("id"),
-                    }
-                )
+            answer_segments.append(f"{load_id}: {', '.join(segment_parts)}")
+            sources.extend(
+                {
+                    "filename": doc.get("filename"),
+                    "document_type": doc.get("document_type"),
+                    "similarity": 0.99,
+                    "document_id": doc.get("id"),
+                }
+                for doc in (rate_conf, invoice, bol)
+                if doc
+            )
 
         if not answer_segments:
             return None
 
-        elapsed = (time.time() - started) * 1000
-        answer_text = " | ".join(answer_segments)
+        elapsed = (time.perf_counter() - started) * 1000
         if len(answer_segments) == 1:
-            answer_text = f"Load {answer_text}"
+            answer_text = f"Load {answer_segments[0]}"
+        else:
+            answer_text = " | ".join(answer_segments)
         return CopilotQueryResponse(
             answer=answer_text,
             sources=sources,
@@ -2097,17 +2594,15 @@ class OpsEngine:
         )
 
     async def copilot_query(self, request: CopilotQueryRequest, tenant_id: str) -> CopilotQueryResponse:
-        started = time.time()
+        started = time.perf_counter()
         query = str(request.query or "").strip()
         mode = str(request.mode or "auto").strip().lower()
         session_id = str(request.session_id or "atlas").strip() or "atlas"
         if not query:
-            return CopilotQueryResponse(
-                answer="Ask me about loads, drivers, tickets, billing, or doc facts for a load ID.",
-                sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
+            return self._reply(
+                started,
+                "Ask me about loads, drivers, tickets, billing, or doc facts for a load ID.",
                 confidence=1.0,
-                processing_time_ms=(time.time() - started) * 1000,
-                route="deterministic",
             )
 
         if mode == "free_roam":
@@ -2120,29 +2615,30 @@ class OpsEngine:
             )
             if free_roam is not None:
                 return free_roam
-            return CopilotQueryResponse(
-                answer=(
+            return self._reply(
+                started,
+                (
                     "Free-roam agent is not available in this process. "
                     "Restart backend after setting OPENROUTER_API_KEY."
                 ),
-                sources=[{"filename": "runtime", "document_type": "system_state", "similarity": 1.0}],
                 confidence=0.2,
-                processing_time_ms=(time.time() - started) * 1000,
+                source="runtime",
                 route="free_roam_unavailable",
             )
-        elif mode == "auto":
-            q = query.lower()
-            follow_up_intent = any(token in q for token in ["you do it", "do it", "handle it", "resolve it", "assign them"])
-            if follow_up_intent:
-                free_roam = await self._free_roam_agent.query(
-                    query=query,
-                    tenant_id=tenant_id,
-                    actor="atlas",
-                    session_id=session_id,
-                    load_id_hint=request.load_id,
-                )
-                if free_roam is not None:
-                    return free_roam
+
+        # Same memoized scan the state and doc-fact answers read, so the query is normalized once.
+        q, query_load_ids = self._scan_query(query)
+        intents = _query_intents(q)
+        if mode == "auto" and "follow_up" in intents:
+            free_roam = await self._free_roam_agent.query(
+                query=query,
+                tenant_id=tenant_id,
+                actor="atlas",
+                session_id=session_id,
+                load_id_hint=request.load_id,
+            )
+            if free_roam is not None:
+                return free_roam
 
         try:
             state_answer = self._try_ops_state_answer(query, tenant_id=tenant_id, started=started)
@@ -2150,36 +2646,40 @@ class OpsEngine:
                 return state_answer
         except Exception as exc:
             logger.error("Copilot state-answer failed", error=str(exc), tenant_id=tenant_id, query=query)
-            return CopilotQueryResponse(
-                answer=(
+            return self._reply(
+                started,
+                (
                     "I can still run dispatch actions, but state lookup failed for that question. "
                     "Try again or refresh demo data."
                 ),
-                sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
                 confidence=0.55,
-                processing_time_ms=(time.time() - started) * 1000,
-                route="deterministic",
             )
 
+        # The caller's load is read once and shared by the doc-fact answer and the RAG prompt.
+        request_load_id = self._normalize_load_id(request.load_id) if request.load_id else None
+        request_load = await ops_state_store.aget_load(tenant_id, request_load_id) if request_load_id else None
         fact_answer = self._try_document_fact_answer(
             query,
             tenant_id=tenant_id,
             started=started,
             load_id_hint=request.load_id,
+            prefetched_load=request_load,
         )
         if fact_answer is not None:
             return fact_answer
 
+        if not (request.load_id or query_load_ids or intents) and not vector_store.has_chunks(tenant_id):
+            # Retrieval is certain to come back empty, so skip the context build, embedding and generation.
+            return await self._unanswered_reply(query, tenant_id, mode, session_id, request.load_id, started)
+
         system_context = self._build_system_context(tenant_id)
         rag_query = query
-        if request.load_id:
-            load = ops_state_store.get_load(tenant_id, request.load_id)
-            if load:
-                rag_query = (
-                    f"Load context for {request.load_id}: customer={load.get('customer')}, "
-                    f"pickup={load.get('pickup_location')}, dropoff={load.get('delivery_location')}. "
-                    f"Question: {query}"
-                )
+        if request_load:
+            rag_query = (
+                f"Load context for {request.load_id}: customer={request_load.get('customer')}, "
+                f"pickup={request_load.get('pickup_location')}, dropoff={request_load.get('delivery_location')}. "
+                f"Question: {query}"
+            )
 
         try:
             response = await rag_engine.query(
@@ -2202,37 +2702,16 @@ class OpsEngine:
             )
         except Exception as exc:
             logger.error("Copilot document-answer failed", error=str(exc), tenant_id=tenant_id, query=query)
-            return CopilotQueryResponse(
-                answer=(
+            return self._reply(
+                started,
+                (
                     "Document QA is temporarily unavailable, but live dispatch state is online. "
                     "Try asking about drivers, loads, ticket queue, or billing readiness."
                 ),
-                sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
                 confidence=0.6,
-                processing_time_ms=(time.time() - started) * 1000,
-                route="deterministic",
             )
         if response.confidence <= 0.2 and not response.sources:
-            if mode in {"auto", "free_roam"}:
-                free_roam = await self._free_roam_agent.query(
-                    query=query,
-                    tenant_id=tenant_id,
-                    actor="atlas",
-                    session_id=session_id,
-                    load_id_hint=request.load_id,
-                )
-                if free_roam is not None:
-                    return free_roam
-            return CopilotQueryResponse(
-                answer=(
-                    "I can help with live dispatch actions and load facts. "
-                    "Try adding a load ID (example: LOAD00030) or ask about drivers and active loads."
-                ),
-                sources=[{"filename": "system_state", "document_type": "system_state", "similarity": 1.0}],
-                confidence=0.7,
-                processing_time_ms=response.processing_time_ms,
-                route="deterministic",
-            )
+            return await self._unanswered_reply(query, tenant_id, mode, session_id, request.load_id, started)
         return CopilotQueryResponse(
             answer=response.answer,
             sources=response.sources,
@@ -2241,6 +2720,35 @@ class OpsEngine:
             route="deterministic",
         )
 
+    async def _unanswered_reply(
+        self,
+        query: str,
+        tenant_id: str,
+        mode: str,
+        session_id: str,
+        load_id_hint: Optional[str],
+        started: float,
+    ) -> CopilotQueryResponse:
+        """Free-roam handoff (auto/free_roam modes), else a pointer to what the deterministic copilot can answer."""
+        if mode in {"auto", "free_roam"}:
+            free_roam = await self._free_roam_agent.query(
+                query=query,
+                tenant_id=tenant_id,
+                actor="atlas",
+                session_id=session_id,
+                load_id_hint=load_id_hint,
+            )
+            if free_roam is not None:
+                return free_roam
+        return self._reply(
+            started,
+            (
+                "I can help with live dispatch actions and load facts. "
+                "Try adding a load ID (example: LOAD00030) or ask about drivers and active loads."
+            ),
+            confidence=0.7,
+        )
+
     def timeline(self, tenant_id: str, load_id: str) -> Dict[str, Any]:
         load = ops_state_store.get_load(tenant_id, load_id)
         if not load:
@@ -2291,7 +2799,8 @@ class OpsEngine:
         if not self.settings.is_demo_mode():
             raise RuntimeError("Synthetic seed is disabled in production mode.")
 
-        seeded = self.seed_synthetic(
+        seeded = await asyncio.to_thread(
+            self.seed_synthetic,
             tenant_id=tenant_id,
             seed=request.seed,
             loads=request.loads,
@@ -2302,13 +2811,18 @@ class OpsEngine:
         docs_per_load = max(1, min(int(request.docs_per_load), 5))
 
         drivers = ops_state_store.list_drivers(tenant_id)
+        pending_docs: list[Document] = []
         docs_to_index: list[tuple[Document, list[tuple[str, dict]]]] = []
-        created_docs = 0
         indexed_docs = 0
         notes: list[str] = []
 
+        # Bound once; the document loop below runs loads x docs_per_load times.
+        split_chunks = document_processor.chunk_text
+        processed = DocumentStatus.PROCESSED
+        index_documents = request.index_documents
+        seeded_loads = {row["load_id"]: row for row in await ops_state_store.alist_loads(tenant_id)}
         for idx, load_id in enumerate(load_ids):
-            load = ops_state_store.get_load(tenant_id, load_id) or {}
+            load = seeded_loads.get(load_id) or {}
             driver = drivers[idx % len(drivers)] if drivers else {}
             broker = str(load.get("broker") or "Coyote Logistics, LLC").strip()
             customer = str(load.get("customer") or "A-1 BLOCK CORPORATION").strip()
@@ -2320,122 +2834,54 @@ class OpsEngine:
             bol = f"BOL{(numeric + 37) % 999999:06d}"
             pro = f"PRO{(numeric + 71) % 999999:06d}"
             invoice = f"INV-2026-{load_id}"
-
-            docs_payload = [
-                (
-                    DocumentType.RATE_CONFIRMATION,
-                    f"RateConf_{rate_conf}_{broker}.pdf",
-                    {
-                        "load_number": load_id,
-                        "broker_name": broker,
-                        "rate_conf_number": rate_conf,
-                        "rate": total_rate,
-                        "rate_per_mile": rate_per_mile,
-                        "miles": miles,
-                        "pickup_location": load.get("pickup_location"),
-                        "delivery_location": load.get("delivery_location"),
-                        "equipment_type": load.get("equipment_type") or "bulk",
-                    },
-                    (
-                        f"Rate Confirmation {rate_conf}\n"
-                        f"Load: {load_id}\nBroker: {broker}\nCustomer: {customer}\n"
-                        f"Pickup: {load.get('pickup_location')} | Delivery: {load.get('delivery_location')}\n"
-                        f"Miles: {miles}\nRate: ${total_rate:,.2f}\nRate per mile: ${rate_per_mile:,.2f}\n"
-                        f"Target rate quality: lane verified for detention and billing."
-                    ),
-                ),
-                (
-                    DocumentType.INVOICE,
-                    f"Invoice_{invoice}_{broker}.pdf",
-                    {
-                        "invoice_number": invoice,
-                        "load_number": load_id,
-                        "broker_name": broker,
-                        "total_amount": total_rate,
-                    },
-                    (
-                        f"Invoice {invoice}\nLoad: {load_id}\nBroker: {broker}\n"
-                        f"Amount Due: ${total_rate:,.2f}\n"
-                        f"Ticket Review: approved for billing pipeline.\n"
-                        f"Generated by SHAMS demo pack."
-                    ),
-                ),
-                (
-                    DocumentType.BOL,
-                    f"BOL_{bol}_{load_id}.pdf",
-                    {
-                        "bol_number": bol,
-                        "load_number": load_id,
-                        "pro_number": pro,
-                        "driver_name": driver.get("name") or "Carlos Rodriguez",
-                        "equipment_type": load.get("equipment_type") or "bulk",
-                        "weight": "42000 lb",
-                        "reference_number": f"REF-{numeric:06d}",
-                    },
-                    (
-                        f"Bill of Lading {bol}\nLoad: {load_id}\nPRO: {pro}\n"
-                        f"Driver: {driver.get('name') or 'Carlos Rodriguez'}\n"
-                        f"Equipment: {load.get('equipment_type') or 'bulk'}\n"
-                        f"Shipper: {customer}\nConsignee: {load.get('delivery_location')}\n"
-                        "Weight: 42000 lb\n"
-                    ),
-                ),
-                (
-                    DocumentType.POD,
-                    f"POD_{pro}_{load_id}.pdf",
-                    {
-                        "load_number": load_id,
-                        "pro_number": pro,
-                        "bol_number": bol,
-                        "delivered_to": customer,
-                        "signed_for_by": "Dock Supervisor",
-                        "delivery_date": "2026-02-16",
-                    },
-                    (
-                        f"Proof of Delivery\nLoad: {load_id}\nPRO: {pro}\nBOL: {bol}\n"
-                        f"Delivered to: {customer}\nSigned by: Dock Supervisor\nCondition: Good\n"
-                    ),
-                ),
-                (
-                    DocumentType.LUMPER_RECEIPT,
-                    f"Lumper_{load_id}_{numeric:06d}.pdf",
-                    {
-                        "receipt_number": f"LMP-{numeric:06d}",
-                        "load_number": load_id,
-                        "pro_number": pro,
-                        "total_fee": 165.0,
-                    },
-                    (
-                        f"Lumper Receipt LMP-{numeric:06d}\nLoad: {load_id}\nPRO: {pro}\n"
-                        "Service: Unloading\nTotal fee: $165.00\n"
-                    ),
-                ),
-            ]
+            # Only the first docs_per_load builders run, so unused payloads are never built.
+            fields = {
+                "load_id": load_id,
+                "broker": broker,
+                "customer": customer,
+                "pickup": load.get("pickup_location"),
+                "delivery": load.get("delivery_location"),
+                "miles": miles,
+                "total_rate": total_rate,
+                "rate_per_mile": rate_per_mile,
+                "total_usd": _format_usd(total_rate),
+                "rate_per_mile_usd": _format_usd(rate_per_mile),
+                "numeric": numeric,
+                "rate_conf": rate_conf,
+                "bol": bol,
+                "pro": pro,
+                "invoice": invoice,
+                "driver_name": driver.get("name") or "Carlos Rodriguez",
+                "equipment": load.get("equipment_type") or "bulk",
+            }
 
             now = datetime.now(timezone.utc)
-            for ordinal, (doc_type, filename, extracted_data, raw_text) in enumerate(docs_payload[:docs_per_load]):
+            for ordinal, build in enumerate(_DEMO_PACK_BUILDERS[:docs_per_load]):
+                doc_type, filename, extracted_data, raw_text = build(fields)
                 document = Document(
                     id=f"demo-{load_id.lower()}-{doc_type.value}-{ordinal}",
                     filename=filename,
                     document_type=doc_type,
-                    status=DocumentStatus.PROCESSED,
+                    status=processed,
                     raw_text=raw_text,
                     extracted_data=extracted_data,
                     metadata={"tenant_id": tenant_id, "source": "synthetic_demo_pack"},
                     created_at=now,
                     processed_at=now,
                 )
-                document_registry.upsert(document, tenant_id=tenant_id)
-                if request.index_documents:
-                    chunks = document_processor.chunk_text(document.raw_text, chunk_size=600, chunk_overlap=80)
+                pending_docs.append(document)
+                if index_documents:
+                    chunks = split_chunks(document.raw_text, chunk_size=600, chunk_overlap=80)
                     if chunks:
                         docs_to_index.append((document, chunks))
-                created_docs += 1
+
+        # One registry write for the whole pack instead of a full file rewrite per document.
+        created_docs = len(document_registry.upsert_bulk(pending_docs, tenant_id=tenant_id))
 
         if docs_to_index and request.index_documents:
             try:
                 all_chunks = [chunk_text for _, chunks in docs_to_index for chunk_text, _ in chunks]
-                embeddings = await embedding_service.embed_batch(all_chunks)
+                embeddings = await _embed_in_windows(all_chunks)
                 cursor = 0
                 bulk_payload: list[tuple[Document, list[tuple[str, dict]], list[list[float]]]] = []
                 for document, chunks in docs_to_index:
@@ -2449,7 +2895,7 @@ class OpsEngine:
         elif not request.index_documents:
             notes.append("Vector indexing skipped by request for faster demo preload.")
 
-        ops_state_store.record_timeline_event(
+        await ops_state_store.arecord_timeline_event(
             tenant_id,
             load_id="SYSTEM",
             event_type="demo_pack_seeded",
@@ -2478,19 +2924,16 @@ class OpsEngine:
         actor: str,
     ) -> AutonomyRunResponse:
         """Run one deterministic autonomous operations cycle."""
-        loads = ops_state_store.list_loads(tenant_id)[: request.max_loads]
-        reviews_by_load: dict[str, dict[str, Any]] = {}
-        for row in ops_state_store.list_reviews(tenant_id):
-            load_id = row.get("load_id")
-            if not load_id:
-                continue
-            if load_id not in reviews_by_load:
-                reviews_by_load[load_id] = row
+        loads = (await ops_state_store.alist_loads(tenant_id))[: request.max_loads]
+        reviews_by_load = ops_state_store.latest_reviews_by_load(tenant_id)
 
         assigned = 0
         reviewed = 0
         exported = 0
         errors: list[str] = []
+        # The list keeps scan order for the gather below; the set answers membership.
+        pending_reviews: list[str] = []
+        queued_reviews: set[str] = set()
 
         for load in loads:
             load_id = str(load.get("load_id", "")).strip()
@@ -2503,29 +2946,35 @@ class OpsEngine:
                 try:
                     assignment = ops_state_store.auto_assign_load(tenant_id, load_id)
                     assigned += 1
-                    ops_state_store.record_timeline_event(
+                    await ops_state_store.arecord_timeline_event(
                         tenant_id,
                         load_id,
                         event_type="load_assigned",
                         actor=actor,
                         details={"mode": "autonomous", **assignment},
                     )
-                    load = ops_state_store.get_load(tenant_id, load_id) or load
+                    load = await ops_state_store.aget_load(tenant_id, load_id) or load
                 except Exception as exc:
                     errors.append(f"{load_id}: assignment failed: {exc}")
                     continue
 
-            if load_id not in reviews_by_load:
-                try:
-                    result = await self.review_ticket(
-                        TicketReviewRequest(load_id=load_id),
-                        tenant_id=tenant_id,
-                        actor=actor,
-                    )
-                    reviews_by_load[load_id] = result.model_dump(mode="json")
-                    reviewed += 1
-                except Exception as exc:
-                    errors.append(f"{load_id}: review failed: {exc}")
+            if load_id not in reviews_by_load and load_id not in queued_reviews:
+                queued_reviews.add(load_id)
+                pending_reviews.append(load_id)
+
+        gate = asyncio.Semaphore(_AUTONOMY_REVIEW_CONCURRENCY)
+
+        async def review(load_id: str) -> TicketReviewResult:
+            async with gate:
+                return await self.review_ticket(TicketReviewRequest(load_id=load_id), tenant_id=tenant_id, actor=actor)
+
+        results = await asyncio.gather(*(review(load_id) for load_id in pending_reviews), return_exceptions=True)
+        for load_id, result in zip(pending_reviews, results):
+            if isinstance(result, BaseException):
+                errors.append(f"{load_id}: review failed: {result}")
+                continue
+            reviews_by_load[load_id] = result.model_dump(mode="json")
+            reviewed += 1
 
         if request.include_exports:
             existing_exports = {row.get("load_id") for row in ops_state_store.list_exports(tenant_id)}
@@ -2542,7 +2991,7 @@ class OpsEngine:
                 except Exception as exc:
                     errors.append(f"{load_id}: export failed: {exc}")
 
-        ops_state_store.record_timeline_event(
+        await ops_state_store.arecord_timeline_event(
             tenant_id,
             load_id="SYSTEM",
             event_type="autonomy_cycle",
@@ -120,14 +120,14 @@ Always prioritize safety and compliance in your answers."""
         extra_context: str | None = None,
     ) -> QueryResponse:
         """Execute a RAG query."""
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             # Include extra_context in cache key if present
             cache_key = self._cache_key(f"{request.query}|{extra_context or ''}", tenant_id, request.document_types)
             cached = self._cache_get(cache_key)
             if cached:
-                processing_time = (time.time() - start_time) * 1000
+                processing_time = (time.perf_counter() - start_time) * 1000
                 self._record_query_metric("cache_hit", processing_time, success=True)
                 return QueryResponse(
                     answer=cached["answer"],
@@ -151,7 +151,7 @@ Always prioritize safety and compliance in your answers."""
             )
 
             if not retrieved_chunks and not extra_context:
-                processing_time = (time.time() - start_time) * 1000
+                processing_time = (time.perf_counter() - start_time) * 1000
                 self._record_query_metric("no_retrieval", processing_time, success=False)
                 return QueryResponse(
                     answer="I couldn't find any relevant documents to answer your question. Try uploading related documents or rephrasing your query.",
@@ -165,7 +165,7 @@ Always prioritize safety and compliance in your answers."""
                 context = f"SYSTEM STATE:\n{extra_context}\n\n---\n\n{context}"
 
             if not context:
-                processing_time = (time.time() - start_time) * 1000
+                processing_time = (time.perf_counter() - start_time) * 1000
                 self._record_query_metric("empty_context", processing_time, success=False)
                 return QueryResponse(
                     answer="I found documents, but could not extract enough text to answer. Try a more specific question.",
@@ -182,7 +182,7 @@ Always prioritize safety and compliance in your answers."""
 
             avg_similarity = sum(s["similarity"] for s in sources) / len(sources)
             confidence = min(avg_similarity * 1.2, 0.95)
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = (time.perf_counter() - start_time) * 1000
             self._record_query_metric(route, processing_time, success=True)
 
             logger.info(
@@ -210,7 +210,7 @@ Always prioritize safety and compliance in your answers."""
             )
 
         except Exception as exc:
-            self._record_query_metric("error", (time.time() - start_time) * 1000, success=False)
+            self._record_query_metric("error", (time.perf_counter() - start_time) * 1000, success=False)
             logger.error("RAG query failed", error=str(exc))
             raise
 
@@ -268,7 +268,7 @@ Always prioritize safety and compliance in your answers."""
             row = self._response_cache.get(key)
             if not row:
                 return None
-            if (time.time() - row["ts"]) > self._cache_ttl_seconds:
+            if (time.monotonic() - row["ts"]) > self._cache_ttl_seconds:
                 self._response_cache.pop(key, None)
                 return None
             return row
@@ -279,7 +279,7 @@ Always prioritize safety and compliance in your answers."""
                 "answer": answer,
                 "sources": sources,
                 "confidence": confidence,
-                "ts": time.time(),
+                "ts": time.monotonic(),
             }
             # Keep memory bounded under heavy repeated demos.
             if len(self._response_cache) > 2000:
@@ -477,7 +477,7 @@ Always prioritize safety and compliance in your answers."""
                     answer=answer,
                     sources=self._source_list_from_docs([bol_doc]),
                     confidence=0.92,
-                    processing_time_ms=(time.time() - start_time) * 1000,
+                    processing_time_ms=(time.perf_counter() - start_time) * 1000,
                 )
 
         load_match = self.LOAD_ID_PATTERN.search(query)
@@ -486,7 +486,7 @@ Always prioritize safety and compliance in your answers."""
                 answer="Please include a load ID (example: LOAD00030) so I can return exact broker/invoice/rate details.",
                 sources=[],
                 confidence=0.95,
-                processing_time_ms=(time.time() - start_time) * 1000,
+                processing_time_ms=(time.perf_counter() - start_time) * 1000,
             )
 
         if not load_match:
@@ -499,7 +499,7 @@ Always prioritize safety and compliance in your answers."""
                 answer=f"I couldn't find documents for load {load_id} in this tenant.",
                 sources=[],
                 confidence=0.6,
-                processing_time_ms=(time.time() - start_time) * 1000,
+                processing_time_ms=(time.perf_counter() - start_time) * 1000,
             )
 
         def first_doc(doc_type: str) -> dict | None:
@@ -535,7 +535,7 @@ Always prioritize safety and compliance in your answers."""
                 answer=answer,
                 sources=self._source_list_from_docs([bol_doc]),
                 confidence=0.9,
-                processing_time_ms=(time.time() - start_time) * 1000,
+                processing_time_ms=(time.perf_counter() - start_time) * 1000,
             )
 
         if not asks_ap_facts:
@@ -577,7 +577,7 @@ Always prioritize safety and compliance in your answers."""
             answer=answer,
             sources=self._source_list_from_docs(related_docs[:5]),
             confidence=0.9,
-            processing_time_ms=(time.time() - start_time) * 1000,
+            processing_time_ms=(time.perf_counter() - start_time) * 1000,
         )
 
     @staticmethod
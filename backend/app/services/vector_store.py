@@ -393,6 +393,13 @@ class VectorStore:
             removed=before - len(self._rows),
         )
 
+    def has_chunks(self, tenant_id: str) -> bool:
+        """Whether ``search`` could return anything for this tenant, read from the kernel's metadata column."""
+        with self._lock:
+            tenant_column = self._metadata_columns.get("tenant_id")
+            dim = self._embedding_dim
+        return bool(dim > 0 and tenant_column is not None and (tenant_column == tenant_id).any())
+
     def get_stats(self, tenant_id: Optional[str] = None) -> dict:
         unique_docs = set()
         total_chunks = 0
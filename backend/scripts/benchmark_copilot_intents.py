@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Benchmark deterministic copilot intent routing against a seeded ops store."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+# Read-only phrasings only: assign/schedule/review intents mutate the board between samples.
+QUERY_TEMPLATES = [
+    "which drivers are available",
+    "how many drivers",
+    "driver roster",
+    "how many active loads are unassigned",
+    "show flagged tickets in the queue",
+    "what is the route for {load_id}",
+    "how many miles on load {load_id}",
+    "who has {load_id}",
+    "did the ticket for {load_id} pass",
+    "is there a ticket issue on {load_id}",
+]
+
+
+def percentile(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = int((len(ordered) - 1) * p)
+    return ordered[max(0, min(len(ordered) - 1, idx))]
+
+
+def summarize(latencies_ms: list[float]) -> dict:
+    return {
+        "avg_ms": round(statistics.mean(latencies_ms), 4),
+        "p50_ms": round(percentile(latencies_ms, 0.50), 4),
+        "p95_ms": round(percentile(latencies_ms, 0.95), 4),
+        "max_ms": round(max(latencies_ms), 4),
+        "min_ms": round(min(latencies_ms), 4),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SHAMS copilot intent routing")
+    parser.add_argument("--tenant-id", default="bench")
+    parser.add_argument("--loads", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--target-p95-ms", type=float, default=10.0)
+    parser.add_argument("--output", type=Path, help="Optional output JSON report path")
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+
+    with tempfile.TemporaryDirectory(prefix="shams-copilot-bench-") as tmp:
+        # The ops store and its neighbours are module singletons, so paths must be set before import.
+        os.environ["OPS_DB_PATH"] = str(Path(tmp) / "ops_state.db")
+        os.environ["MCLEOD_EXPORT_DIR"] = str(Path(tmp) / "mcleod_exports")
+        os.environ["DOCUMENT_REGISTRY_PATH"] = str(Path(tmp) / "document_registry.json")
+        os.environ["VECTOR_INDEX_PATH"] = str(Path(tmp) / "vector_index.jsonl")
+        os.environ["UPLOAD_DIR"] = str(Path(tmp) / "uploads")
+
+        from app.core.config import get_settings
+
+        get_settings.cache_clear()
+
+        from app.services.ops_engine import OpsEngine, _query_intents, ops_engine
+        from app.services.ops_state import ops_state_store
+
+        ops_state_store.seed_synthetic_scenario(args.tenant_id, seed=args.seed, loads=max(1, args.loads), exception_ratio=0.25)
+        load_ids = [row["load_id"] for row in ops_state_store.list_loads(args.tenant_id)]
+        for load_id in load_ids[: max(1, len(load_ids) // 3)]:
+            try:
+                ops_state_store.auto_assign_load(args.tenant_id, load_id)
+            except Exception:
+                break
+
+        queries = [
+            random.choice(QUERY_TEMPLATES).format(load_id=random.choice(load_ids))
+            for _ in range(max(1, args.queries))
+        ]
+
+        def run(cold: bool) -> tuple[list[float], int]:
+            latencies_ms: list[float] = []
+            answered = 0
+            for query in queries:
+                if cold:
+                    _query_intents.cache_clear()
+                    OpsEngine._scan_query.cache_clear()
+                started = time.perf_counter()
+                response = ops_engine._try_ops_state_answer(query, tenant_id=args.tenant_id, started=started)
+                latencies_ms.append((time.perf_counter() - started) * 1000.0)
+                answered += response is not None
+            return latencies_ms, answered
+
+        warm, answered = run(cold=False)
+        cold, _ = run(cold=True)
+
+    report = {
+        "samples": len(warm),
+        "answered": answered,
+        **summarize(warm),
+        "cold_cache": summarize(cold),
+        "target_p95_ms": args.target_p95_ms,
+    }
+    report["pass"] = bool(report["p95_ms"] <= args.target_p95_ms and answered == len(warm))
+    print(json.dumps(report, indent=2))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    if not report["pass"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 """API-level tests for SHAMS autonomous ops router."""
 from __future__ import annotations
 
+import asyncio
 import os
 import sys
+import threading
+import uuid
 from pathlib import Path
 
 from fastapi.testclient import TestClient
@@ -25,8 +28,13 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from app.main import app  # noqa: E402
 from app.core.config import get_settings  # noqa: E402
-from app.models.ops import CopilotQueryResponse  # noqa: E402
-from app.services.ops_engine import ops_engine  # noqa: E402
+from app.models.document import Document  # noqa: E402
+from app.models.ops import AutonomyRunRequest, CopilotQueryResponse, LoadRecord, TicketReviewRequest  # noqa: E402
+from app.services.document_registry import document_registry  # noqa: E402
+from app.services.ops_engine import _AUTONOMY_REVIEW_CONCURRENCY, ops_engine  # noqa: E402
+from app.services.ops_state import ops_state_store  # noqa: E402
+from app.services.rag_engine import rag_engine  # noqa: E402
+from app.services.vector_store import vector_store  # noqa: E402
 
 
 client = TestClient(app)
@@ -236,6 +244,19 @@ def test_copilot_free_roam_mode_falls_back_when_provider_unavailable():
     assert payload["route"] in {"deterministic", "free_roam", "free_roam_unavailable"}
 
 
+def test_copilot_skips_rag_when_nothing_could_be_retrieved(monkeypatch):
+    async def _unexpected_rag(*args, **kwargs):
+        raise AssertionError("RAG should not run for an off-vocabulary query with no indexed chunks")
+
+    monkeypatch.setattr(rag_engine, "query", _unexpected_rag)
+    monkeypatch.setattr(vector_store, "has_chunks", lambda tenant_id: False)
+    response = client.post("/ops/copilot/query", json={"query": "tell me something nice", "mode": "deterministic"})
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["route"] == "deterministic"
+    assert payload["answer"].startswith("I can help with live dispatch actions")
+
+
 def test_copilot_free_roam_mode_uses_agent_when_available(monkeypatch):
     async def _fake_query(query: str, tenant_id: str, actor: str, session_id: str = "atlas", load_id_hint: str | None = None):
         return CopilotQueryResponse(
@@ -364,6 +385,45 @@ def test_autonomy_cycle_assigns_and_reviews_new_loads():
     assert "ticket_reviewed" in event_types
 
 
+def test_autonomy_cycle_gathers_reviews_and_reports_each_failure(monkeypatch):
+    tenant = "autonomy_gather"
+    ops_state_store.reset_tenant_operational_data(tenant)
+    load_ids = [ops_state_store.generate_load_id(tenant) for _ in range(_AUTONOMY_REVIEW_CONCURRENCY + 2)]
+    for load_id in load_ids:
+        ops_state_store.upsert_load(
+            tenant,
+            LoadRecord(load_id=load_id, customer="GATHER", pickup_location="Tampa", delivery_location="Naples"),
+        )
+    failing = load_ids[3]
+    real_review = ops_engine.review_ticket
+    in_flight = 0
+    peak = 0
+
+    async def tracked_review(request, tenant_id, actor):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            await asyncio.sleep(0.02)
+            if request.load_id == failing:
+                raise RuntimeError("scanner offline")
+            return await real_review(request, tenant_id=tenant_id, actor=actor)
+        finally:
+            in_flight -= 1
+
+    monkeypatch.setattr(ops_engine, "review_ticket", tracked_review)
+    result = asyncio.run(
+        ops_engine.run_autonomy_cycle(AutonomyRunRequest(max_loads=50, include_exports=False), tenant, "tester")
+    )
+
+    assert result.assigned_loads == len(load_ids)
+    assert result.reviewed_loads == len(load_ids) - 1
+    assert result.errors == [f"{failing}: review failed: scanner offline"]
+    assert peak == _AUTONOMY_REVIEW_CONCURRENCY
+    reviewed = {row["load_id"] for row in ops_state_store.list_reviews(tenant)}
+    assert reviewed == set(load_ids) - {failing}
+
+
 def test_load_status_transition_and_version_conflict():
     create = client.post(
         "/ops/dispatch/loads",
@@ -484,6 +544,8 @@ def test_demo_pack_seed_and_ops_state_copilot_answers():
     payload = seeded.json()
     assert payload["loads_created"] == 6
     assert payload["documents_created"] >= 18
+    registered = document_registry.find_related(payload["load_ids"][0], tenant_id="demo")
+    assert {"rate_confirmation", "invoice", "bill_of_lading"} <= {row["document_type"] for row in registered}
 
     drivers = client.post(
         "/ops/copilot/query",
@@ -537,6 +599,38 @@ def test_copilot_handles_driver_and_load_state_intents():
     assert "driver roster" in roster.json()["answer"].lower()
 
 
+def test_copilot_driver_listing_fast_path_matches_route_table():
+    from app.services.ops_engine import OpsEngine, _DRIVER_LISTING_QUERIES, _query_intents
+
+    def first_route(signals: set[str]):
+        for required, forbidden, handler in OpsEngine._OPS_STATE_ROUTES:
+            if required <= signals and forbidden.isdisjoint(signals):
+                return handler
+        return None
+
+    for phrase in _DRIVER_LISTING_QUERIES:
+        q, load_ids = OpsEngine._scan_query(phrase)
+        assert not load_ids
+        assert ops_engine._extract_ticket_reference(phrase) is None
+        intents = set(_query_intents(q))
+        # A driver named in the query must not change the route either.
+        for signals in (intents, intents | {"driver_named"}):
+            assert first_route(signals) is OpsEngine._answer_driver_overview, phrase
+
+
+def test_system_context_is_rebuilt_only_after_store_writes():
+    from app.services.ops_state import ops_state_store
+
+    tenant = "context_cache"
+    first = ops_engine._build_system_context(tenant)
+    assert ops_engine._build_system_context(tenant) is first
+
+    ops_state_store.set_driver_status(tenant, "DRV-101", "off_duty")
+    rebuilt = ops_engine._build_system_context(tenant)
+    assert rebuilt is not first
+    assert "Off_Duty" in rebuilt
+
+
 def test_copilot_ticket_flags_and_ticket_lookup():
     load_resp = client.post(
         "/ops/dispatch/loads",
@@ -712,3 +806,45 @@ def test_copilot_route_miles_stops_and_multiload_invoice_queries():
     assert str(load_a).lower() in multi_answer
     assert str(load_b).lower() in multi_answer
     assert "invoice" in multi_answer
+
+    bulk = document_registry.find_related_bulk([load_a, load_b, "LOAD99999"], tenant_id="demo")
+    for load_id in (load_a, load_b, "LOAD99999"):
+        assert bulk[load_id] == document_registry.find_related(load_id, tenant_id="demo")
+    assert bulk[load_a]
+
+
+def test_concurrent_ticket_reviews_tolerate_registry_upserts(monkeypatch):
+    load_id = _seed_and_get_load_id()
+    # Skip the JSON rewrite so upserts land fast enough to overlap the reviews' registry scans.
+    monkeypatch.setattr(document_registry, "_save", lambda: None)
+    previous_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    stop = threading.Event()
+    added: list[str] = []
+
+    def upsert_loop() -> None:
+        while not stop.is_set():
+            document = Document(id=f"race-{uuid.uuid4().hex}", filename="race.txt", raw_text=f"Ticket for {load_id}")
+            document_registry.upsert(document, tenant_id="demo")
+            added.append(document.id)
+
+    async def review_all() -> list:
+        requests = [
+            TicketReviewRequest(load_id=load_id, ticket_number=f"TKT-RACE-{index}", gps_miles=100.0, rated_miles=100.0)
+            for index in range(8)
+        ]
+        return await asyncio.gather(*(ops_engine.review_ticket(request, "demo", "tester") for request in requests))
+
+    writer = threading.Thread(target=upsert_loop)
+    writer.start()
+    try:
+        results = [result for _ in range(5) for result in asyncio.run(review_all())]
+    finally:
+        stop.set()
+        writer.join()
+        sys.setswitchinterval(previous_interval)
+        for document_id in added:
+            document_registry.delete(document_id)
+
+    assert len(results) == 40
+    assert all(result.load_id == load_id for result in results)
@@ -1,9 +1,13 @@
 """Unit tests for ops state persistence and KPI calculations."""
 from __future__ import annotations
 
+import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import os
+import sqlite3
+import subprocess
 import sys
+import uuid
 from pathlib import Path
 
 
@@ -14,7 +18,8 @@ os.environ["MCLEOD_EXPORT_DIR"] = str(TMP / "mcleod_exports")
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-from app.models.ops import LoadRecord  # noqa: E402
+from app.models.ops import LoadRecord, LoadStatus  # noqa: E402
+from app.services import ops_state  # noqa: E402
 from app.services.ops_state import OpsStateStore  # noqa: E402
 
 
@@ -47,14 +52,53 @@ def test_load_upsert_assignment_and_export_lifecycle():
 
     assignment = store.auto_assign_load(tenant, load_id)
     assert assignment["mode"] == "autonomous"
+    assigned = store.get_load(tenant, load_id)
+    assert assigned["assignment"] == assignment
+    assert assigned["version"] == 2
+    assert assigned["updated_at"] == assignment["assigned_at"]
+    assert assigned["customer"] == "A-1 BLOCK"
 
-    export = store.add_export(tenant, load_id, {"load_id": load_id, "ticket": "TKT-123"})
+    driver_id = assignment["driver_id"]
+    before = next(d for d in store.list_drivers(tenant) if d["driver_id"] == driver_id)
+    try:
+        store.assign_load(tenant, "LOAD-MISSING", driver_id, None, None)
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("assigning an unknown load should raise KeyError")
+    after = next(d for d in store.list_drivers(tenant) if d["driver_id"] == driver_id)
+    assert after["assignment_count"] == before["assignment_count"]
+
+    export = store.add_export(tenant, load_id, {"load_id": load_id, "ticket": "TKT-123", "note": "café"})
     assert export["status"] == "generated"
-    assert Path(export["artifact_path"]).exists()
+    artifact_text = Path(export["artifact_path"]).read_text(encoding="utf-8")
+    assert artifact_text == f'{{"load_id": "{load_id}", "ticket": "TKT-123", "note": "caf\\u00e9"}}'
 
     replay = store.replay_export(tenant, export["export_id"])
     assert replay["status"] == "replayed"
 
+    cached = store.get_load(tenant, load_id)
+    cached["status"] = "scratch"
+    again = store.get_load(tenant, load_id)
+    assert again["status"] == "assigned" and again is not cached
+    assert again["assignment"] is store.get_load(tenant, load_id)["assignment"]
+    store.upsert_load(tenant, load.model_copy(update={"customer": "B-2 BLOCK"}))
+    assert store.get_load(tenant, load_id)["customer"] == "B-2 BLOCK"
+
+    # A write from another connection (another worker or script on the same file) must not be masked by the LRU.
+    outside = sqlite3.connect(str(store._db_path))
+    with outside:
+        outside.execute(
+            """
+            UPDATE loads
+            SET data_json = json_set(data_json, '$.customer', 'OUTSIDE'), updated_at = '2099-01-01T00:00:00+00:00'
+            WHERE tenant_id = ? AND load_id = ?
+            """,
+            (tenant, load_id),
+        )
+    outside.close()
+    assert store.get_load(tenant, load_id)["customer"] == "OUTSIDE"
+
 
 def test_concurrent_sequence_generation_is_unique():
     store = OpsStateStore()
@@ -69,6 +113,10 @@ def test_concurrent_sequence_generation_is_unique():
     assert len(load_ids) == 200
     assert len(set(load_ids)) == 200
 
+    fresh = f"sequence_{uuid.uuid4().hex[:8]}"
+    assert [store.next_sequence(fresh, "load") for _ in range(2)] == [1000, 1001]
+    assert store.next_sequence(fresh, "event") == 1
+
 
 def test_samsara_ingest_query_and_latest_miles():
     store = OpsStateStore()
@@ -88,3 +136,476 @@ def test_samsara_ingest_query_and_latest_miles():
     latest = store.latest_samsara_miles(tenant, "load001", hours_back=24)
     assert latest is not None
     assert latest >= 88.3
+
+    stops = store.samsara_stops_by_load(tenant, ["load001", "LOAD002", "LOAD999"], hours_back=24)
+    assert stops["LOAD001"] == sum(event["stop_events"] for event in events)
+    assert stops["LOAD002"] == sum(
+        event["stop_events"] for event in store.query_samsara_events(tenant, ["LOAD002"], hours_back=24)
+    )
+    assert "LOAD999" not in stops
+    assert store.samsara_stops_by_load(tenant, [], hours_back=24) == {}
+
+    vehicle = f"V-{uuid.uuid4().hex[:8]}"
+    batch = [
+        {"load_id": "LOAD003", "gps_miles": 12.5, "vehicle_id": vehicle, "event_time": "2026-02-12T10:00:00Z"},
+        {"load_id": "LOAD003", "gps_miles": 12.5, "vehicle_id": vehicle, "event_time": "2026-02-12T10:00:00Z"},
+        {"load_id": "", "gps_miles": 1.0},
+    ]
+    assert store.ingest_samsara_events(tenant, batch) == {"ingested": 1, "skipped": 1}
+    assert store.ingest_samsara_events(tenant, batch[:1]) == {"ingested": 0, "skipped": 0}
+
+    sent = store.add_dispatch_message(tenant, {"load_id": " load003 ", "driver_id": "DRV-001"})
+    assert sent["load_id"] == "LOAD003"
+    listed = store.list_dispatch_messages(tenant, load_id="Load003")
+    assert [row["dispatch_id"] for row in listed][:1] == [sent["dispatch_id"]]
+
+
+def test_list_loads_pushes_status_and_assignment_filters_into_store():
+    store = OpsStateStore()
+    tenant = "filter_loads"
+    store.reset_tenant_operational_data(tenant)
+    store.reset_driver_pool(tenant)
+    planned_ids = []
+    for miles in (30, 40, 50):
+        load_id = store.generate_load_id(tenant)
+        store.upsert_load(
+            tenant,
+            LoadRecord(
+                load_id=load_id,
+                customer="FILTER",
+                pickup_location="Tampa Plant",
+                delivery_location="Jobsite",
+                planned_miles=miles,
+                rate_total=100.0,
+            ),
+        )
+        planned_ids.append(load_id)
+
+    store.auto_assign_load(tenant, planned_ids[0])
+    store.reset_driver_pool(tenant)
+    assert {(row["status"], row["assignment_count"]) for row in store.list_drivers(tenant)} == {("available", 0)}
+    store.auto_assign_load(tenant, planned_ids[0])
+
+    planned = store.list_loads(tenant, status="planned", unassigned_only=True)
+    assert {row["load_id"] for row in planned} == set(planned_ids[1:])
+    assigned = store.list_loads(tenant, status=LoadStatus.ASSIGNED)
+    assert [row["load_id"] for row in assigned] == [planned_ids[0]]
+    in_flight = store.list_loads(tenant, status_in=[LoadStatus.ASSIGNED, LoadStatus.EN_ROUTE.value])
+    assert [row["load_id"] for row in in_flight] == [planned_ids[0]]
+    plan = store._conn.execute(
+        "EXPLAIN QUERY PLAN SELECT data_json FROM loads WHERE tenant_id = ? AND json_extract(data_json, '$.status') IN (?)",
+        (tenant, "planned"),
+    ).fetchall()
+    assert any("idx_loads_tenant_status" in row["detail"] for row in plan)
+    fetched = store.get_loads(tenant, [planned_ids[0], planned_ids[2], "LOAD99999", planned_ids[0]])
+    assert set(fetched) == {planned_ids[0], planned_ids[2]}
+    assert fetched[planned_ids[0]]["status"] == "assigned"
+    assert store.get_loads(tenant, []) == {}
+
+    counts = store.status_counts(tenant)
+    assert counts["loads"] == {"planned": 2, "assigned": 1}
+    drivers = store.list_drivers(tenant)
+    assert sum(counts["drivers"].values()) == len(drivers)
+    assert counts["drivers"]["assigned"] == sum(1 for row in drivers if row["status"] == "assigned") == 1
+
+
+def test_record_timeline_events_bulk_allocates_contiguous_ids():
+    store = OpsStateStore()
+    tenant = "bulk_timeline"
+    store.reset_tenant_operational_data(tenant)
+    single = store.record_timeline_event(tenant, "LD-1", event_type="seed", actor="pytest")
+    recorded = store.record_timeline_events_bulk(
+        tenant,
+        [
+            {"load_id": "LD-1", "event_type": "bulk_a", "actor": "pytest", "details": {"n": 1}},
+            {"load_id": "LD-2", "event_type": "bulk_b", "actor": "pytest"},
+        ],
+    )
+    first = int(single["event_id"].split("-")[1])
+    assert [row["event_id"] for row in recorded] == [f"EVT-{first + 1:06d}", f"EVT-{first + 2:06d}"]
+    assert recorded[1]["details"] == {}
+    assert store.record_timeline_events_bulk(tenant, []) == []
+    event_types = {row["event_type"] for row in store.list_timeline(tenant)}
+    assert {"seed", "bulk_a", "bulk_b"} <= event_types
+
+
+def test_version_counter_advances_on_writes_and_is_shared_per_db():
+    store = OpsStateStore()
+    other = OpsStateStore()
+    tenant = "version_counter"
+    store.reset_tenant_operational_data(tenant)
+    before = store.version(tenant)
+    store.list_loads(tenant)
+    assert store.version(tenant) == before
+    store.set_driver_status(tenant, "DRV-101", "available")
+    assert store.version(tenant) > before
+    assert other.version(tenant) == store.version(tenant)
+
+    first = store.list_reviews(tenant)
+    again = store.list_reviews(tenant)
+    assert again == first and again is not first
+    other.store_review(
+        tenant,
+        {"review_id": "REV-V", "load_id": "LOAD07001", "status": "approved", "created_at": "2026-01-01T00:00:00+00:00"},
+    )
+    assert [row["review_id"] for row in store.list_reviews(tenant)] == ["REV-V"] + [row["review_id"] for row in first]
+
+
+def test_review_lookups_by_load_and_ticket_reference():
+    store = OpsStateStore()
+    tenant = "review_lookups"
+    store.reset_tenant_operational_data(tenant)
+    store.store_review(
+        tenant,
+        {
+            "review_id": "REV-A",
+            "load_id": "LOAD01001",
+            "ticket_number": "TKT-55501",
+            "status": "exception",
+            "created_at": "2026-01-01T00:00:00+00:00",
+        },
+    )
+    store.store_review(
+        tenant,
+        {
+            "review_id": "REV-B",
+            "load_id": "LOAD01001",
+            "ticket_number": "TKT-55502",
+            "status": "approved",
+            "created_at": "2026-01-02T00:00:00+00:00",
+        },
+    )
+
+    assert [row["review_id"] for row in store.reviews_for_load(tenant, "LOAD01001")] == ["REV-B", "REV-A"]
+    assert store.reviews_for_load(tenant, "LOAD09999") == []
+    store.store_review(
+        tenant,
+        {
+            "review_id": "REV-L",
+            "load_id": "load01004",
+            "ticket_number": "TKT-66601",
+            "status": "approved",
+            "created_at": "2026-01-02T00:00:00+00:00",
+        },
+    )
+    assert [row["review_id"] for row in store.reviews_for_load(tenant, " LOAD01004")] == ["REV-L"]
+    assert store.find_review_by_ticket(tenant, "55501")["review_id"] == "REV-A"
+    assert store.find_review_by_ticket(tenant, "tkt 555")["review_id"] == "REV-B"
+    assert store.find_review_by_ticket(tenant, "77777") is None
+
+    store.store_review(
+        tenant,
+        {
+            "review_id": "REV-C",
+            "load_id": "LOAD01002",
+            "ticket_number": "TKT-55501",
+            "status": "exception",
+            "created_at": "2026-01-03T00:00:00+00:00",
+        },
+    )
+    store.store_review(
+        tenant,
+        {
+            "review_id": "REV-D",
+            "load_id": "LOAD01003",
+            "ticket_number": "",
+            "status": "exception",
+            "created_at": "2026-01-04T00:00:00+00:00",
+        },
+    )
+    flagged = store.latest_reviews_by_ticket(tenant, "exception", limit=5)
+    assert [row["review_id"] for row in flagged] == ["REV-D", "REV-C"]
+    assert [row["review_id"] for row in store.latest_reviews_by_ticket(tenant, "exception", limit=1)] == ["REV-D"]
+
+    latest = store.latest_reviews_by_load(tenant)
+    assert {load_id: row["review_id"] for load_id, row in latest.items()} == {
+        "LOAD01001": "REV-B",
+        "load01004": "REV-L",
+        "LOAD01002": "REV-C",
+        "LOAD01003": "REV-D",
+    }
+
+    resolved = store.set_review_status(tenant, "REV-C", "resolved", note="docs received")
+    assert resolved["status"] == "resolved" and resolved["approval_reason"] == "docs received"
+    assert resolved["ticket_number"] == "TKT-55501"
+    kept = store.set_review_status(tenant, "REV-C", "exception")
+    assert kept["approval_reason"] == "docs received"
+    billing = next(row for row in store.list_billing(tenant) if row["load_id"] == "LOAD01002")
+    assert billing["status"] == "needs_review" and billing["billing_ready"] is False
+    assert billing["ready_reason"] == "manual override"
+    unnoted = store.set_review_status(tenant, "REV-D", "resolved")
+    assert unnoted["approval_reason"] == ""
+
+
+def test_spaced_json_rows_are_compacted_once_by_schema_migration():
+    store = OpsStateStore()
+    tenant = "compact_json"
+    store.reset_tenant_operational_data(tenant)
+    store._conn.execute(
+        "INSERT INTO loads (tenant_id, load_id, data_json, updated_at) VALUES (?, ?, ?, ?)",
+        (tenant, "LOAD00001", '{"load_id": "LOAD00001", "status": "planned"}', "2026-01-01T00:00:00+00:00"),
+    )
+    store._conn.execute("PRAGMA user_version = 0")
+    store._conn.commit()
+
+    OpsStateStore()
+    raw = store._conn.execute(
+        "SELECT data_json FROM loads WHERE tenant_id = ? AND load_id = ?", (tenant, "LOAD00001")
+    ).fetchone()["data_json"]
+    assert raw == '{"load_id":"LOAD00001","status":"planned"}'
+    assert store.get_load(tenant, "LOAD00001")["status"] == "planned"
+    assert int(store._conn.execute("PRAGMA user_version").fetchone()[0]) >= 1
+
+
+def test_status_tags_are_lowercased_on_write_and_by_schema_migration():
+    store = OpsStateStore()
+    tenant = "status_tags"
+    store.reset_tenant_operational_data(tenant)
+    store.upsert_load(tenant, LoadRecord(load_id="LOAD00001", customer="TAGS", pickup_location="Tampa", delivery_location="Naples"))
+    store.store_review(tenant, {"review_id": "REV-1", "load_id": "LOAD00001", "status": "Exception"})
+    store.set_driver_status(tenant, "DRV-101", "Assigned")
+    stored = store._conn.execute(
+        "SELECT status, json_extract(data_json, '$.status') AS tag FROM reviews WHERE tenant_id = ? AND review_id = ?",
+        (tenant, "REV-1"),
+    ).fetchone()
+    assert (stored["status"], stored["tag"]) == ("exception", "exception")
+    driver_tag = store._conn.execute(
+        "SELECT json_extract(data_json, '$.status') FROM drivers WHERE tenant_id = ? AND driver_id = ?",
+        (tenant, "DRV-101"),
+    ).fetchone()[0]
+    assert driver_tag == "assigned"
+
+    store._conn.execute(
+        "UPDATE loads SET data_json = json_set(data_json, '$.status', 'Delivered') WHERE tenant_id = ? AND load_id = ?",
+        (tenant, "LOAD00001"),
+    )
+    store._conn.execute(
+        "UPDATE reviews SET status = 'APPROVED', data_json = json_set(data_json, '$.status', 'APPROVED') "
+        "WHERE tenant_id = ? AND review_id = ?",
+        (tenant, "REV-1"),
+    )
+    store._conn.execute("PRAGMA user_version = 1")
+    store._conn.commit()
+
+    OpsStateStore()
+    load_tag = store._conn.execute(
+        "SELECT json_extract(data_json, '$.status') FROM loads WHERE tenant_id = ? AND load_id = ?", (tenant, "LOAD00001")
+    ).fetchone()[0]
+    assert load_tag == "delivered"
+    assert [row["status"] for row in store.list_reviews(tenant, "approved")] == ["approved"]
+    assert int(store._conn.execute("PRAGMA user_version").fetchone()[0]) == 2
+
+
+def test_driver_pool_bootstrap_is_restored_after_last_driver_removed():
+    store = OpsStateStore()
+    tenant = "bootstrap_cache"
+    store.reset_tenant_operational_data(tenant)
+    drivers = store.list_drivers(tenant)
+    assert len(drivers) == 4
+    for driver in drivers:
+        assert store.remove_driver(tenant, driver_ref=driver["driver_id"])["removed"]
+    assert [row["driver_id"] for row in store.list_drivers(tenant)] == [row["driver_id"] for row in drivers]
+
+
+def test_timeline_retention_is_pruned_in_batches(monkeypatch):
+    monkeypatch.setitem(ops_state._RETENTION, "timeline", ("timestamp", 3))
+    monkeypatch.setattr(ops_state, "_PRUNE_EVERY", 2)
+    store = OpsStateStore()
+    tenant = "timeline_prune"
+    store.reset_tenant_operational_data(tenant)
+    recorded = [store.record_timeline_event(tenant, "LD-1", event_type="tick", actor="pytest") for _ in range(5)]
+    assert len(store.list_timeline(tenant)) == 4
+    recorded += store.record_timeline_events_bulk(tenant, [{"load_id": "LD-1", "event_type": "tick", "actor": "pytest"}])
+    assert [row["event_id"] for row in store.list_timeline(tenant)] == [row["event_id"] for row in recorded[-3:][::-1]]
+
+
+def test_retention_keeps_newest_rows_when_timestamps_tie(monkeypatch):
+    monkeypatch.setitem(ops_state._RETENTION, "samsara_events", ("captured_at", 3))
+    monkeypatch.setattr(ops_state, "_PRUNE_EVERY", 1)
+    store = OpsStateStore()
+    tenant = "tied_prune"
+    store.reset_tenant_operational_data(tenant)
+    tied = [
+        {"load_id": "LOAD010", "gps_miles": float(miles), "event_time": "2026-02-12T10:00:00Z"}
+        for miles in range(5)
+    ]
+    assert store.ingest_samsara_events(tenant, tied)["ingested"] == 5
+    remaining = store.query_samsara_events(tenant, ["LOAD010"], hours_back=24 * 3650)
+    assert sorted(row["gps_miles"] for row in remaining) == [2.0, 3.0, 4.0]
+
+
+def test_prune_write_count_is_shared_by_stores_on_the_same_file(monkeypatch):
+    monkeypatch.setitem(ops_state._RETENTION, "samsara_events", ("captured_at", 2))
+    monkeypatch.setattr(ops_state, "_PRUNE_EVERY", 4)
+    first = OpsStateStore()
+    second = OpsStateStore()
+    tenant = "shared_prune"
+    first.reset_tenant_operational_data(tenant)
+    for miles, store in enumerate((first, second, first, second)):
+        event = {"load_id": "LOAD020", "gps_miles": float(miles), "event_time": f"2026-02-12T10:0{miles}:00Z"}
+        store.ingest_samsara_events(tenant, [event])
+    remaining = first.query_samsara_events(tenant, ["LOAD020"], hours_back=24 * 3650)
+    assert sorted(row["gps_miles"] for row in remaining) == [2.0, 3.0]
+
+
+def test_pooled_readers_do_not_wait_for_the_writer_lock():
+    store = OpsStateStore()
+    tenant = "read_pool"
+    store.reset_tenant_operational_data(tenant)
+    load_id = store.generate_load_id(tenant)
+    store.upsert_load(
+        tenant,
+        LoadRecord(load_id=load_id, customer="POOL", pickup_location="Tampa", delivery_location="Naples"),
+    )
+
+    with store._lock, ThreadPoolExecutor(max_workers=2) as pool:
+        load = pool.submit(store.get_load, tenant, load_id).result(timeout=5)
+        drivers = pool.submit(store.list_drivers, tenant).result(timeout=5)
+        async_load = asyncio.run(asyncio.wait_for(store.aget_load(tenant, load_id), timeout=5))
+    assert load["customer"] == "POOL"
+    assert async_load == load
+    assert len(drivers) == 4
+
+
+def test_failed_write_is_rolled_back_without_bumping_version(monkeypatch):
+    store = OpsStateStore()
+    tenant = "rollback"
+    store.reset_tenant_operational_data(tenant)
+    before = store.version(tenant)
+
+    def _boom(*args, **kwargs):
+        raise RuntimeError("prune failed")
+
+    monkeypatch.setattr(OpsStateStore, "_prune_retained", _boom)
+    try:
+        store.record_timeline_event(tenant, "LD-1", event_type="lost", actor="pytest")
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("expected the write to fail")
+    monkeypatch.undo()
+
+    assert store.version(tenant) == before
+    assert store.list_timeline(tenant) == []
+    assert not store._conn.in_transaction
+    event = store.record_timeline_event(tenant, "LD-1", event_type="kept", actor="pytest")
+    assert [row["event_id"] for row in store.list_timeline(tenant)] == [event["event_id"]]
+    assert store.version(tenant) == before + 1
+
+    with store.batch(tenant):
+        store.record_timeline_event(tenant, "LD-2", event_type="first", actor="pytest")
+        store.record_timeline_event(tenant, "LD-2", event_type="second", actor="pytest")
+        assert store._conn.in_transaction
+    assert store.version(tenant) == before + 2
+    assert len(store.list_timeline(tenant, load_id="LD-2")) == 2
+
+    try:
+        with store.batch(tenant):
+            store.record_timeline_event(tenant, "LD-3", event_type="dropped", actor="pytest")
+            raise RuntimeError("abort batch")
+    except RuntimeError:
+        pass
+    assert store.list_timeline(tenant, load_id="LD-3") == []
+    assert store.version(tenant) == before + 2
+
+
+def test_driver_dedupe_and_active_load_guard_use_store_lookups():
+    store = OpsStateStore()
+    tenant = "driver_lookups"
+    store.reset_tenant_operational_data(tenant)
+    store.reset_driver_pool(tenant)
+    created = store.create_driver(tenant, name="Ana  Lopez")
+    assert created["created"]
+    duplicate = store.create_driver(tenant, name="ana lopez")
+    assert not duplicate["created"]
+    assert duplicate["driver"]["driver_id"] == created["driver"]["driver_id"]
+
+    load_id = store.generate_load_id(tenant)
+    store.upsert_load(tenant, LoadRecord(load_id=load_id, customer="GUARD", pickup_location="Tampa", delivery_location="Naples"))
+    driver_id = created["driver"]["driver_id"]
+    store.assign_load(tenant, load_id, driver_id, None, None)
+    blocked = store.remove_driver(tenant, driver_ref="ANA LOPEZ")
+    assert not blocked["removed"]
+    assert blocked["reason"] == f"driver has active loads: {load_id}"
+
+    store.reset_tenant_operational_data(tenant)
+    assert store.remove_driver(tenant, driver_ref=driver_id.lower())["removed"]
+    assert store.remove_driver(tenant, driver_ref=driver_id)["reason"] == f"driver '{driver_id}' not found"
+
+
+def test_driver_name_lookups_fold_non_ascii_case():
+    store = OpsStateStore()
+    tenant = "driver_lookups_unicode"
+    store.reset_tenant_operational_data(tenant)
+    store.reset_driver_pool(tenant)
+    created = store.create_driver(tenant, name="Émile Zola")
+    assert created["created"]
+    duplicate = store.create_driver(tenant, name="émile  zola")
+    assert not duplicate["created"]
+    assert duplicate["driver"]["driver_id"] == created["driver"]["driver_id"]
+
+    removed = store.remove_driver(tenant, driver_ref="ÉMILE ZOLA")
+    assert removed["removed"]
+    assert removed["driver"]["driver_id"] == created["driver"]["driver_id"]
+
+
+def test_chunked_seed_inside_batch_rolls_back_with_the_batch(monkeypatch):
+    store = OpsStateStore()
+    tenant = "seed_in_batch"
+    store.reset_tenant_operational_data(tenant)
+    monkeypatch.setattr(ops_state, "_SEED_COMMIT_EVERY", 2)
+    try:
+        with store.batch(tenant):
+            store.seed_synthetic_scenario(tenant, seed=3, loads=5, exception_ratio=0.2)
+            raise RuntimeError("abort batch")
+    except RuntimeError:
+        pass
+    assert store.list_loads(tenant) == []
+    assert store.list_reviews(tenant) == []
+
+    seeded = store.seed_synthetic_scenario(tenant, seed=3, loads=5, exception_ratio=0.2)
+    assert len(store.list_loads(tenant)) == seeded["loads_created"] == 5
+
+
+def test_batch_reads_see_the_batch_own_uncommitted_writes():
+    store = OpsStateStore()
+    tenant = "batch_reads"
+    store.reset_tenant_operational_data(tenant)
+    store.reset_driver_pool(tenant)
+    load_ids = [store.generate_load_id(tenant) for _ in range(2)]
+    assert store.list_loads(tenant) == []
+
+    with store.batch(tenant):
+        for load_id in load_ids:
+            store.upsert_load(tenant, LoadRecord(load_id=load_id, customer="BATCH", pickup_location="Tampa", delivery_location="Naples"))
+        assert store.get_load(tenant, load_ids[0])["customer"] == "BATCH"
+        assert {row["load_id"] for row in store.list_loads(tenant)} == set(load_ids)
+        first = store.auto_assign_load(tenant, load_ids[0])
+        second = store.auto_assign_load(tenant, load_ids[1])
+    assert first["driver_id"] != second["driver_id"]
+
+    assigned = {row["driver_id"] for row in store.list_drivers(tenant) if row["status"] == "assigned"}
+    assert assigned == {first["driver_id"], second["driver_id"]}
+    assert store.get_load(tenant, load_ids[1])["assignment"]["driver_id"] == second["driver_id"]
+
+
+def test_cached_listings_see_writes_from_other_processes_and_hand_out_copies():
+    store = OpsStateStore()
+    tenant = "listing_cache"
+    store.reset_tenant_operational_data(tenant)
+    store.upsert_load(tenant, LoadRecord(load_id="LOAD70001", customer="LOCAL", pickup_location="Tampa", delivery_location="Naples"))
+    listed = store.list_loads(tenant)
+    listed[0]["customer"] = "scratch"
+    assert store.list_loads(tenant)[0]["customer"] == "LOCAL"
+
+    script = (
+        "from app.models.ops import LoadRecord\n"
+        "from app.services.ops_state import OpsStateStore\n"
+        f"OpsStateStore().upsert_load({tenant!r}, LoadRecord(load_id='LOAD70002', customer='REMOTE',"
+        " pickup_location='Tampa', delivery_location='Naples'))\n"
+    )
+    before = store.version(tenant)
+    env = {**os.environ, "OPS_DB_PATH": str(store._db_path), "MCLEOD_EXPORT_DIR": str(store._mcleod_export_dir)}
+    subprocess.run([sys.executable, "-c", script], cwd=Path(__file__).resolve().parents[1], env=env, check=True)
+    assert store.version(tenant) > before
+    assert {row["customer"] for row in store.list_loads(tenant)} == {"LOCAL", "REMOTE"}
@@ -41,3 +41,36 @@ def test_vector_kernel_benchmark_script_runs_and_emits_report(tmp_path: Path):
     assert payload["samples"] == 12
     assert payload["kernel"]["type"] == "numpy_cosine_kernel"
     assert payload["pass"] is True
+
+
+def test_copilot_intent_benchmark_script_runs_and_emits_report(tmp_path: Path):
+    backend_root = Path(__file__).resolve().parents[1]
+    report_path = tmp_path / "copilot_intent_report.json"
+    cmd = [
+        sys.executable,
+        "scripts/benchmark_copilot_intents.py",
+        "--loads",
+        "24",
+        "--queries",
+        "40",
+        "--target-p95-ms",
+        "250",
+        "--output",
+        str(report_path),
+    ]
+
+    proc = subprocess.run(
+        cmd,
+        cwd=str(backend_root),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert proc.returncode == 0, f"benchmark failed:\nSTDOUT:\n{proc.stdout}\nSTDERR:\n{proc.stderr}"
+    assert report_path.exists()
+
+    payload = json.loads(report_path.read_text(encoding="utf-8"))
+    assert payload["samples"] == 40
+    assert payload["answered"] == 40
+    assert "p95_ms" in payload["cold_cache"]
+    assert payload["pass"] is True
@@ -119,3 +119,5 @@ def test_vector_kernel_applies_tenant_type_and_metadata_filters():
         )
     )
     assert no_cross_tenant == []
+    assert store.has_chunks("demo") and store.has_chunks("other")
+    assert not store.has_chunks("nobody")